@@ -1,10 +1,14 @@
 from .user_card import UserCard
 from .comment_card import CommentCard
 from .photo_card import PhotoCard
+from .canvas_cards import CanvasPhotoCard, CanvasCommentCard
+from .table_view import ListingTable
 from .management_frames import (
     UserManagementFrame,
     CommentManagementFrame,
     PhotoManagementFrame,
+    DuplicatePhotosFrame,
+    SpamCommentsFrame,
     FilmDevelopmentFrame
 )
 from .login_frame import LoginFrame
@@ -13,9 +17,14 @@ __all__ = [
     'UserCard',
     'CommentCard',
     'PhotoCard',
+    'CanvasPhotoCard',
+    'CanvasCommentCard',
+    'ListingTable',
     'UserManagementFrame',
     'CommentManagementFrame',
     'PhotoManagementFrame',
+    'DuplicatePhotosFrame',
+    'SpamCommentsFrame',
     'FilmDevelopmentFrame',
     'LoginFrame'
 ] 
\ No newline at end of file
@@ -0,0 +1,153 @@
+import tkinter as tk
+import customtkinter as ctk
+from PIL import ImageTk
+
+from ..services import get_image_loader
+from ..models import Photo, Comment
+from .image_owner import ImageOwnerMixin
+from .photo_card import PhotoCard
+from .comment_card import CommentCard
+
+class CanvasCard(ImageOwnerMixin, tk.Canvas):
+    """Base for cards drawn on a single canvas instead of nested CTk widgets.
+
+    A CTk widget is itself a canvas with its own grid layout, so a widget card
+    costs a dozen canvases and geometry passes. These cards draw the same
+    content as canvas items: one widget per card, positioned by hand.
+    """
+
+    PADDING = 10
+
+    def __init__(self, master, on_delete_callback, **kwargs):
+        super().__init__(master, highlightthickness=0, **kwargs)
+        self.on_delete = on_delete_callback
+        self.images = []  # Decoded thumbnails, released in destroy()
+        self.photo_images = []  # Tk copies; canvas items do not keep them alive
+        self.scaling = ctk.ScalingTracker.get_widget_scaling(self)
+        self.theme_items = []  # (item, option, (light, dark)) recolored on appearance changes
+
+        self.bind("<Configure>", self.place_button)
+        ctk.AppearanceModeTracker.add(self.set_appearance_mode, self)
+
+    def px(self, value: float) -> int:
+        return round(value * self.scaling)
+
+    def font(self, size: int, weight: str = "normal"):
+        # Negative sizes are pixels, which is how CTk interprets font tuples
+        return ("Arial", -self.px(size), weight)
+
+    def themed(self, item, option: str, colors):
+        self.theme_items.append((item, option, colors))
+        return item
+
+    def set_appearance_mode(self, mode: str):
+        index = 1 if mode.lower() == "dark" else 0
+        self.configure(bg=self.theme_color(ctk.ThemeManager.theme["CTkFrame"]["top_fg_color"], index))
+        for item, option, colors in self.theme_items:
+            self.itemconfigure(item, **{option: self.theme_color(colors, index)})
+
+    @staticmethod
+    def theme_color(colors, index: int) -> str:
+        return colors[index] if isinstance(colors, (list, tuple)) else colors
+
+    def draw_text(self, x, y, text, size=13, weight="normal", width=0):
+        item = self.create_text(x, y, text=text, anchor="nw", font=self.font(size, weight), width=width)
+        return self.themed(item, "fill", ctk.ThemeManager.theme["CTkLabel"]["text_color"])
+
+    def draw_image(self, url, x, y, size, placeholder):
+        """Thumbnail centered in a size x size box once loaded, or the placeholder text."""
+        box = self.px(size)
+        center = (x + box / 2, y + box / 2)
+        text = self.draw_text(*center, "Loading..." if size >= 100 else placeholder)
+        self.itemconfigure(text, anchor="center", justify="center")
+
+        def show_image(img):
+            if img is None:
+                self.itemconfigure(text, text=placeholder)
+                return
+            self.delete(text)
+            self.images.append(img)
+            photo_img = ImageTk.PhotoImage(img, master=self)
+            self.photo_images.append(photo_img)
+            self.create_image(*center, image=photo_img)
+
+        get_image_loader().load(self, url, show_image, size=(box, box))
+
+    def draw_button(self, text, command):
+        """A red delete button; kept on the right edge by place_button."""
+        width, height = self.px(140), self.px(28)
+        rect = self.create_rectangle(0, 0, width, height, fill="red", outline="", tags="button")
+        self.create_text(width / 2, height / 2, text=text, fill="white",
+                         font=self.font(13), tags="button")
+        self.tag_bind("button", "<Enter>", lambda e: self.itemconfigure(rect, fill="darkred"))
+        self.tag_bind("button", "<Leave>", lambda e: self.itemconfigure(rect, fill="red"))
+        self.tag_bind("button", "<Button-1>", lambda e: command())
+
+    def place_button(self, event=None):
+        x1, y1, x2, y2 = self.bbox("button")
+        self.move("button", self.winfo_width() - self.px(self.PADDING) - x2,
+                  (self.winfo_height() - (y2 - y1)) / 2 - y1)
+
+    def fit_height(self, minimum):
+        self.configure(height=max(self.px(minimum), self.bbox("all")[3] + self.px(self.PADDING)))
+
+    def destroy(self):
+        ctk.AppearanceModeTracker.remove(self.set_appearance_mode)
+        super().destroy()
+        self.photo_images.clear()
+
+class CanvasPhotoCard(CanvasCard):
+    """Drop-in replacement for PhotoCard drawn on one canvas."""
+
+    def __init__(self, master, photo: Photo, on_delete_callback, **kwargs):
+        super().__init__(master, on_delete_callback, **kwargs)
+        self.photo = photo
+        self.draw()
+        self.set_appearance_mode(ctk.get_appearance_mode())
+
+    def draw(self):
+        pad = self.px(self.PADDING)
+        self.draw_image(self.photo.url, pad, pad, 200, "Photo\nNot Available")
+
+        x = self.px(200) + 3 * pad
+        self.draw_text(x, pad, self.photo.title or "Untitled", 16, "bold", width=self.px(400))
+        y = self.bbox("all")[3] + self.px(10)
+        label = self.draw_text(x, y, "Posted by:", 12)
+        self.draw_text(self.bbox(label)[2] + self.px(5), y, self.photo.username, 12, "bold")
+        y += self.px(30)
+        self.draw_text(x, y, f"❤️ {self.photo.like_count} likes     💬 {self.photo.comment_count} comments", 12)
+        y += self.px(30)
+        self.draw_text(x, y, f"Posted on: {self.photo.creation_date_formatted}", 10)
+
+        self.draw_button("Delete Photo", self.delete_photo)
+        self.fit_height(200 + 2 * self.PADDING)
+
+    # Same confirmation and messages as the widget card
+    delete_photo = PhotoCard.delete_photo
+
+class CanvasCommentCard(CanvasCard):
+    """Drop-in replacement for CommentCard drawn on one canvas."""
+
+    def __init__(self, master, comment: Comment, on_delete_callback, **kwargs):
+        super().__init__(master, on_delete_callback, **kwargs)
+        self.comment = comment
+        self.draw()
+        self.set_appearance_mode(ctk.get_appearance_mode())
+
+    def draw(self):
+        pad = self.px(self.PADDING)
+        self.draw_image(self.comment.photo_url, pad, pad, 150, "Photo\nNot Available")
+
+        x = self.px(150) + 3 * pad
+        self.draw_image(self.comment.user_profile_image, x, pad, 30, "?")
+        self.draw_text(x + self.px(40), pad + self.px(6), self.comment.username, 14, "bold")
+        content = self.draw_text(x, pad + self.px(40), self.comment.content, width=self.px(400))
+        y = self.bbox(content)[3] + self.px(10)
+        self.draw_text(x, y, f"On photo: {self.comment.photo_title or 'Untitled'}", 12)
+        self.draw_text(x, y + self.px(20), f"Posted on: {self.comment.creation_date_formatted}", 10)
+
+        self.draw_button("Delete Comment", self.delete_comment)
+        self.fit_height(150 + 2 * self.PADDING)
+
+    # Same confirmation and messages as the widget card
+    delete_comment = CommentCard.delete_comment
@@ -0,0 +1,106 @@
+"""Compare the widget cards with the canvas-drawn ones.
+
+Builds a page of each card class against generated data and a local image
+server, and reports per card the build time (including the Tk layout pass),
+the Python memory allocated, the RSS growth and the number of widgets:
+
+    python -m admin_tool.components.card_benchmark --cards 100
+
+Images are fetched once before timing, so only decoding and drawing are
+measured; a page counts as built once the loader has drawn every image. It needs a display; on a headless machine run it under ``xvfb-run``.
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+import customtkinter as ctk
+
+from ..models import Photo, Comment
+from ..services import get_image_client, get_image_loader
+from ..services.fake_image_server import FakeImageServer
+from ..services.memory import count_widgets, current_rss
+from .photo_card import PhotoCard
+from .comment_card import CommentCard
+from .canvas_cards import CanvasPhotoCard, CanvasCommentCard
+
+def sample_items(server, count: int):
+    now = datetime.now()
+    photos = [Photo(id=i, url=server.url(f"/photo/{i}.png"), title=f"Photo {i}", created_at=now - timedelta(days=i),
+                    user_id=i, username=f"user{i}", email=f"user{i}@example.com", like_count=i, comment_count=i)
+              for i in range(count)]
+    comments = [Comment(id=i, content=f"Comment {i} " * (1 + i % 20), created_at=now - timedelta(days=i),
+                        user_id=i, photo_id=i, username=f"user{i}", user_profile_image=server.url(f"/profile/{i}.png"),
+                        photo_url=server.url(f"/photo/{i}.png"), photo_title=f"Photo {i}")
+                for i in range(count)]
+    return photos, comments
+
+def build_page(root, card_class, field: str, items) -> dict:
+    """Build one card per item in a fresh scrollable frame and measure it."""
+    page = ctk.CTkScrollableFrame(root)
+    page.pack(fill="both", expand=True)
+    page.grid_columnconfigure(0, weight=1)
+    root.update()
+    gc.collect()
+
+    widgets_before = count_widgets(page)
+    rss_before = current_rss()
+    traced_before = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    for i, item in enumerate(items):
+        card = card_class(page, on_delete_callback=lambda item_id: None, **{field: item})
+        card.grid(row=i, column=0, pady=(0, 10), sticky="ew")
+    # Images arrive from the loader threads; the page is done once they are drawn
+    while get_image_loader().pending:
+        root.update()
+        time.sleep(0.001)
+    root.update()
+    elapsed = time.perf_counter() - start
+    traced = tracemalloc.get_traced_memory()[0] - traced_before
+    rss_after = current_rss()
+
+    result = {
+        'ms': elapsed * 1000 / len(items),
+        'traced_kb': traced / 1024 / len(items),
+        'rss_kb': (rss_after - rss_before) / 1024 / len(items) if rss_before is not None else None,
+        'widgets': (count_widgets(page) - widgets_before) / len(items),
+    }
+    page.destroy()
+    root.update()
+    return result
+
+def run(cards: int = 100, repeats: int = 3):
+    server = FakeImageServer().start()
+    photos, comments = sample_items(server, cards)
+    for url in {url for c in comments for url in (c.photo_url, c.user_profile_image)}:
+        get_image_client().fetch(url)
+
+    root = ctk.CTk()
+    root.geometry("1200x800")
+    tracemalloc.start()
+
+    cases = [
+        ("PhotoCard", PhotoCard, 'photo', photos),
+        ("CanvasPhotoCard", CanvasPhotoCard, 'photo', photos),
+        ("CommentCard", CommentCard, 'comment', comments),
+        ("CanvasCommentCard", CanvasCommentCard, 'comment', comments),
+    ]
+    print(f"{'card':<20}{'ms/card':>10}{'KB/card':>10}{'RSS KB/card':>14}{'widgets':>10}")
+    for name, card_class, field, items in cases:
+        # Best of several runs; the first one also warms up fonts and theme lookups
+        results = [build_page(root, card_class, field, items) for _ in range(repeats)]
+        best = min(results, key=lambda result: result['ms'])
+        rss = f"{best['rss_kb']:.1f}" if best['rss_kb'] is not None else "n/a"
+        print(f"{name:<20}{best['ms']:>10.2f}{best['traced_kb']:>10.1f}{rss:>14}{best['widgets']:>10.1f}")
+
+    tracemalloc.stop()
+    root.destroy()
+    server.stop()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare build time and memory of widget and canvas cards")
+    parser.add_argument('--cards', type=int, default=100)
+    parser.add_argument('--repeats', type=int, default=3)
+    args = parser.parse_args()
+    run(args.cards, args.repeats)
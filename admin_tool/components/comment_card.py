@@ -1,32 +1,25 @@
 import customtkinter as ctk
-from PIL import Image, ImageTk
-import requests
-from io import BytesIO
 import tkinter.messagebox as messagebox
 
+from ..services import get_image_loader
 from ..models import Comment
+from .image_owner import ImageOwnerMixin
 
-class CommentCard(ctk.CTkFrame):
+class CommentCard(ImageOwnerMixin, ctk.CTkFrame):
     def __init__(self, master, comment: Comment, on_delete_callback, **kwargs):
         super().__init__(master, **kwargs)
         self.comment = comment
         self.on_delete = on_delete_callback
+        self.images = []  # Decoded thumbnails, released in destroy()
         
         self.grid_columnconfigure(1, weight=1)
         self.create_widgets()
         
     def create_widgets(self):
-        # Photo thumbnail
-        try:
-            response = requests.get(self.comment.photo_url)
-            img = Image.open(BytesIO(response.content))
-            img.thumbnail((150, 150))
-            photo_img = ctk.CTkImage(light_image=img, dark_image=img, size=(150, 150))
-            img_label = ctk.CTkLabel(self, image=photo_img, text="")
-        except:
-            img_label = ctk.CTkLabel(self, text="Photo\nNot Available", width=150, height=150)
-        
-        img_label.grid(row=0, column=0, padx=10, pady=10)
+        # Photo thumbnail, filled in by the loader so a slow image host never blocks the UI
+        self.img_label = ctk.CTkLabel(self, text="Loading...", width=150, height=150)
+        self.img_label.grid(row=0, column=0, padx=10, pady=10)
+        get_image_loader().load(self, self.comment.photo_url, self.show_photo, size=(150, 150))
 
         # Comment info
         info_frame = ctk.CTkFrame(self)
@@ -36,19 +29,9 @@ class CommentCard(ctk.CTkFrame):
         user_frame = ctk.CTkFrame(info_frame)
         user_frame.grid(row=0, column=0, sticky="ew", pady=(0, 10))
         
-        try:
-            if self.comment.user_profile_image:
-                response = requests.get(self.comment.user_profile_image)
-                img = Image.open(BytesIO(response.content))
-                img.thumbnail((30, 30))
-                profile_img = ctk.CTkImage(light_image=img, dark_image=img, size=(30, 30))
-                profile_label = ctk.CTkLabel(user_frame, image=profile_img, text="")
-            else:
-                profile_label = ctk.CTkLabel(user_frame, text="?", width=30, height=30)
-        except:
-            profile_label = ctk.CTkLabel(user_frame, text="?", width=30, height=30)
-        
-        profile_label.grid(row=0, column=0, padx=(0, 10))
+        self.profile_label = ctk.CTkLabel(user_frame, text="?", width=30, height=30)
+        self.profile_label.grid(row=0, column=0, padx=(0, 10))
+        get_image_loader().load(self, self.comment.user_profile_image, self.show_profile, size=(30, 30))
         
         ctk.CTkLabel(user_frame, text=self.comment.username,
                     font=("Arial", 14, "bold")).grid(row=0, column=1, sticky="w")
@@ -76,6 +59,21 @@ class CommentCard(ctk.CTkFrame):
         )
         delete_button.grid(row=0, column=0, pady=5)
         
+    def show_photo(self, img):
+        if img is None:
+            self.img_label.configure(text="Photo\nNot Available")
+            return
+        self.images.append(img)
+        photo_img = ctk.CTkImage(light_image=img, dark_image=img, size=(150, 150))
+        self.img_label.configure(image=photo_img, text="")
+
+    def show_profile(self, img):
+        if img is None:
+            return
+        self.images.append(img)
+        profile_img = ctk.CTkImage(light_image=img, dark_image=img, size=(30, 30))
+        self.profile_label.configure(image=profile_img, text="")
+
     def delete_comment(self):
         if messagebox.askokcancel("Delete Comment", 
                                 f"Are you sure you want to delete this comment by {self.comment.username}?"):
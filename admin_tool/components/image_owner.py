@@ -0,0 +1,12 @@
+class ImageOwnerMixin:
+    """Closes the decoded images in ``self.images`` when the widget is destroyed.
+
+    Must come before the widget class in the bases so destroy() runs first.
+    """
+
+    def destroy(self):
+        super().destroy()
+        # Free the decoded images now instead of whenever the GC gets to them
+        for img in self.images:
+            img.close()
+        self.images.clear()
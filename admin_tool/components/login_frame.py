@@ -3,9 +3,10 @@ from ..database import Database
 import tkinter.messagebox as messagebox
 
 class LoginFrame(ctk.CTkFrame):
-    def __init__(self, master, on_successful_login, **kwargs):
+    def __init__(self, master, on_successful_login, snapshot, **kwargs):
         super().__init__(master, **kwargs)
-        self.db = Database()
+        self.db = None
+        self.snapshot = snapshot
         self.on_successful_login = on_successful_login
 
         # Configure grid
@@ -47,11 +48,27 @@ class LoginFrame(ctk.CTkFrame):
             messagebox.showerror("Error", "Please fill in all fields")
             return
 
+        try:
+            if self.db is None:
+                self.db = Database()
+        except Exception:
+            self.login_offline(email, password)
+            return
+
         try:
             user = self.db.verify_user_login(email, password)
             if user and user.role == 2:  # Admin role
+                self.snapshot.remember_admin(email, password)
                 self.on_successful_login()
             else:
                 messagebox.showerror("Error", "Access denied. Admin privileges required.")
         except Exception as e:
-            messagebox.showerror("Error", str(e)) 
\ No newline at end of file
+            messagebox.showerror("Error", str(e)) 
+
+    def login_offline(self, email, password):
+        # Only admins who logged in online on this machine can open the snapshot
+        if self.snapshot.verify_offline_login(email, password):
+            messagebox.showinfo("Offline", "The database is unreachable. Showing the last snapshot, read-only.")
+            self.on_successful_login()
+        else:
+            messagebox.showerror("Error", "The database is unreachable and no offline snapshot is available for this account.")
\ No newline at end of file
@@ -1,13 +1,70 @@
+import os
+from collections import Counter
 import customtkinter as ctk
+import tkinter.messagebox as messagebox
 from ..database import Database
+from ..services import DuplicateScanner, SpamAnalyzer
 from .user_card import UserCard
 from .photo_card import PhotoCard
 from .comment_card import CommentCard
+from .canvas_cards import CanvasPhotoCard, CanvasCommentCard
+from .table_view import Column, ListingTable
 
-class UserManagementFrame(ctk.CTkFrame):
-    def __init__(self, master, **kwargs):
+USER_COLUMNS = [
+    Column('id', "ID", 60, lambda user: user.id),
+    Column('username', "Username", 160, lambda user: user.username),
+    Column('email', "Email", 220, lambda user: user.email),
+    Column('created_at', "Member since", 130, lambda user: user.creation_date_formatted),
+    Column('photo_count', "Photos", 70, lambda user: user.photo_count),
+    Column('comment_count', "Comments", 80, lambda user: user.comment_count),
+    Column('like_count', "Likes", 70, lambda user: user.like_count),
+]
+
+PHOTO_COLUMNS = [
+    Column('id', "ID", 60, lambda photo: photo.id),
+    Column('title', "Title", 240, lambda photo: photo.title or "Untitled"),
+    Column('username', "Posted by", 160, lambda photo: photo.username),
+    Column('created_at', "Posted on", 130, lambda photo: photo.creation_date_formatted),
+    Column('like_count', "Likes", 70, lambda photo: photo.like_count),
+    Column('comment_count', "Comments", 80, lambda photo: photo.comment_count),
+]
+
+COMMENT_COLUMNS = [
+    Column('id', "ID", 60, lambda comment: comment.id),
+    Column('content', "Comment", 320, lambda comment: " ".join(comment.content.split())[:120]),
+    Column('username', "By", 140, lambda comment: comment.username),
+    Column('photo_title', "On photo", 180, lambda comment: comment.photo_title or "Untitled"),
+    Column('created_at', "Posted on", 130, lambda comment: comment.creation_date_formatted),
+]
+
+class ListingFrame(ctk.CTkFrame):
+    """Cards or a sortable table of one snapshot table, kept in sync with the database.
+
+    Subclasses name the table and its columns and cards and implement
+    delete_row. When deletes can be undone they also implement release_row
+    and restore_row.
+    """
+    table_name = None  # 'users', 'photos' or 'comments'
+    item_name = None  # Keyword the cards take the row as
+    title_text = None
+    columns = []
+    card_class = None
+    canvas_card_class = None  # Cheaper to build, see card_benchmark.py; not used by the table
+    card_spacing = 10
+    undoable = False
+
+    def __init__(self, master, snapshot, events, sync=None, **kwargs):
         super().__init__(master, **kwargs)
-        self.db = Database()
+        self.snapshot = snapshot
+        self.events = events
+        self.db = None
+        # Called with the table name to sync it off the Tk thread (AdminApp.request_sync)
+        self.sync = sync
+
+        # Any write can change the rows or counts shown here
+        self.stale = False
+        self.card_ids = []  # Rows rendered as cards
+        self.events.subscribe(('user', 'photo', 'comment'), self.invalidate)
 
         # Configure grid
         self.grid_columnconfigure(0, weight=1)
@@ -15,135 +72,529 @@ class UserManagementFrame(ctk.CTkFrame):
 
         # Add title
         self.title = ctk.CTkLabel(
-            self, text="User Management",
+            self, text=self.title_text,
             font=ctk.CTkFont(size=24, weight="bold")
         )
         self.title.grid(row=0, column=0, padx=20, pady=(20,10))
 
-        # Create scrollable frame for user cards
+        # Undo is only possible until the background purge picks the delete up
+        self.last_deleted_id = None
+        if self.undoable:
+            self.undo_button = ctk.CTkButton(
+                self, text="Undo Delete", width=120,
+                state="disabled",
+                command=self.undo_delete
+            )
+            self.undo_button.grid(row=0, column=0, padx=20, pady=(20,10), sticky="e")
+
+        # Create scrollable frame for the cards
         self.scrollable_frame = ctk.CTkScrollableFrame(self)
         self.scrollable_frame.grid(row=1, column=0, sticky="nsew", padx=20, pady=10)
         self.scrollable_frame.grid_columnconfigure(0, weight=1)
 
-        # Load and display users
-        self.load_users()
+        self.listing_card_class = self.card_class
+        if self.canvas_card_class and os.getenv('ADMIN_CARD_STYLE') == 'canvas':
+            self.listing_card_class = self.canvas_card_class
+
+        # Dense alternative to the cards for large listings
+        self.table = ListingTable(
+            self, columns=self.columns,
+            fetch_page=self.fetch_page,
+            make_card=lambda master, item: self.card_class(
+                master, on_delete_callback=self.delete_item, **{self.item_name: item}
+            ),
+            page_size=int(os.getenv('ADMIN_TABLE_PAGE_SIZE', 500))
+        )
+        self.view_switch = ctk.CTkSegmentedButton(self, values=["Cards", "Table"], command=self.switch_view)
+        self.view_switch.set("Cards")
+        self.view_switch.grid(row=0, column=0, padx=20, pady=(20,10), sticky="w")
+
+        # Nothing is loaded before login: AdminApp shows the snapshot, then syncs all tabs at once
+        ctk.CTkLabel(self.scrollable_frame, text=f"Loading {self.table_name}...").grid(row=0, column=0, pady=20)
+
+    def connect(self) -> bool:
+        if self.db is None:
+            try:
+                self.db = Database(self.events)
+            except Exception:
+                self.set_offline()
+                return False
+        return True
+
+    def set_offline(self):
+        # Unreachable database: keep showing the snapshot, read-only
+        self.title.configure(text=f"{self.title_text} (offline)")
+
+    def set_online(self):
+        self.title.configure(text=self.title_text)
+
+    def load(self):
+        if self.connect():
+            self.snapshot.sync(self.table_name, self.db, self.visible_ids())
+            self.set_online()
+        self.show_snapshot()
+
+    def show_snapshot(self):
+        if self.is_table_view():
+            self.table.reload()  # Pages are read from the snapshot one at a time
+        else:
+            self.render(self.snapshot.load(self.table_name))
+
+    def is_table_view(self) -> bool:
+        return self.view_switch.get() == "Table"
+
+    def visible_ids(self):
+        # Between full count refreshes, only the rows on screen get fresh counts
+        return [item.id for item in self.table.items.values()] if self.is_table_view() else self.card_ids
+
+    def invalidate(self):
+        # Hidden tabs wait until they are shown again
+        if self.winfo_ismapped():
+            self.refresh()
+        else:
+            self.stale = True
+
+    def on_show(self):
+        if self.stale:
+            self.stale = False
+            self.refresh()
+
+    def refresh(self):
+        # Without AdminApp (e.g. in the memory check) the sync runs inline
+        if self.sync:
+            self.sync(self.table_name)
+        else:
+            self.load()
+
+    def switch_view(self, mode):
+        if mode == "Table":
+            self.scrollable_frame.grid_remove()
+            self.table.grid(row=1, column=0, sticky="nsew", padx=20, pady=10)
+        else:
+            self.table.grid_remove()
+            self.scrollable_frame.grid()
+        self.show_snapshot()
+
+    def fetch_page(self, sort_key, descending, limit, offset):
+        return self.snapshot.load_page(self.table_name, sort_key, descending, limit, offset)
 
-    def load_users(self):
-        users = self.db.get_all_users()
-        
+    def render(self, items):
         # Clear existing widgets
         for widget in self.scrollable_frame.winfo_children():
             widget.destroy()
 
-        # Create user cards
-        for i, user in enumerate(users):
-            user_card = UserCard(
+        if self.is_table_view():
+            # The table queries its own sorted pages; no cards are built
+            self.table.reload()
+            return
+
+        # Create the cards
+        self.card_ids = [item.id for item in items]
+        for i, item in enumerate(items):
+            card = self.listing_card_class(
                 self.scrollable_frame,
-                user=user,
-                on_delete_callback=self.delete_user
+                on_delete_callback=self.delete_item,
+                **{self.item_name: item}
             )
-            user_card.grid(row=i, column=0, pady=(0,10), sticky="ew")
+            card.grid(row=i, column=0, pady=(0, self.card_spacing), sticky="ew")
+
+    def delete_item(self, item_id: int):
+        if not self.connect():
+            raise ConnectionError("The database is unreachable, the offline snapshot is read-only")
+        self.delete_row(item_id)
+        if self.undoable:
+            # Only the last delete can be undone; the previous one can be purged now
+            self.release_undo()
+            self.last_deleted_id = item_id
+            self.undo_button.configure(state="normal")
 
-    def delete_user(self, user_id: int):
+    def release_undo(self):
+        if self.last_deleted_id is None:
+            return
         try:
-            self.db.delete_user(user_id)
-            self.load_users()  # Refresh the list
+            self.release_row(self.last_deleted_id)
         except Exception as e:
-            raise e
+            print(f"Error releasing delete for purge: {e}")
+        self.last_deleted_id = None
+        self.undo_button.configure(state="disabled")
 
-class CommentManagementFrame(ctk.CTkFrame):
-    def __init__(self, master, **kwargs):
+    def undo_delete(self):
+        if self.last_deleted_id is None:
+            return
+        try:
+            if not self.restore_row(self.last_deleted_id):
+                messagebox.showerror(
+                    "Error", f"The {self.item_name} is already being purged and can no longer be restored"
+                )
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to undo delete: {str(e)}")
+        self.last_deleted_id = None
+        self.undo_button.configure(state="disabled")
+
+    def delete_row(self, item_id: int):
+        raise NotImplementedError
+
+    def release_row(self, item_id: int):
+        raise NotImplementedError
+
+    def restore_row(self, item_id: int) -> bool:
+        raise NotImplementedError
+
+class UserManagementFrame(ListingFrame):
+    table_name = 'users'
+    item_name = 'user'
+    title_text = "User Management"
+    columns = USER_COLUMNS
+    card_class = UserCard
+    undoable = True
+
+    def delete_row(self, user_id: int):
+        self.db.delete_user(user_id)
+
+    def release_row(self, user_id: int):
+        self.db.release_user(user_id)
+
+    def restore_row(self, user_id: int) -> bool:
+        return self.db.restore_user(user_id)
+
+class CommentManagementFrame(ListingFrame):
+    table_name = 'comments'
+    item_name = 'comment'
+    title_text = "Comment Management"
+    columns = COMMENT_COLUMNS
+    card_class = CommentCard
+    canvas_card_class = CanvasCommentCard
+
+    def delete_row(self, comment_id: int):
+        self.db.delete_comment(comment_id)
+
+class PhotoManagementFrame(ListingFrame):
+    table_name = 'photos'
+    item_name = 'photo'
+    title_text = "Photo Management"
+    columns = PHOTO_COLUMNS
+    card_class = PhotoCard
+    canvas_card_class = CanvasPhotoCard
+    card_spacing = 20
+    undoable = True
+
+    def delete_row(self, photo_id: int):
+        self.db.delete_photo(photo_id)
+
+    def release_row(self, photo_id: int):
+        self.db.release_photo(photo_id)
+
+    def restore_row(self, photo_id: int) -> bool:
+        return self.db.restore_photo(photo_id)
+
+class DuplicatePhotosFrame(ctk.CTkFrame):
+    MAX_CLUSTERS = 50
+
+    def __init__(self, master, events, **kwargs):
         super().__init__(master, **kwargs)
-        self.db = Database()
+        self.events = events
+        self.db = None
+        self.scanner = None
+        self.index = None
+        self.clusters = []
+
+        # Photos deleted anywhere (also with their user) must leave the groups
+        self.stale = False
+        self.events.subscribe(('user', 'photo'), self.invalidate)
 
         # Configure grid
         self.grid_columnconfigure(0, weight=1)
-        self.grid_rowconfigure(1, weight=1)
+        self.grid_rowconfigure(2, weight=1)
 
         # Add title
         self.title = ctk.CTkLabel(
-            self, text="Comment Management",
+            self, text="Duplicate Photos",
             font=ctk.CTkFont(size=24, weight="bold")
         )
         self.title.grid(row=0, column=0, padx=20, pady=(20,10))
 
-        # Create scrollable frame for comment cards
+        self.scan_button = ctk.CTkButton(
+            self, text="Scan for Duplicates", width=160,
+            command=self.start_scan
+        )
+        self.scan_button.grid(row=0, column=0, padx=20, pady=(20,10), sticky="e")
+
+        self.status_label = ctk.CTkLabel(self, text="Scan to hash new photos and find near-duplicates")
+        self.status_label.grid(row=1, column=0, padx=20)
+
+        # Create scrollable frame for duplicate clusters
         self.scrollable_frame = ctk.CTkScrollableFrame(self)
-        self.scrollable_frame.grid(row=1, column=0, sticky="nsew", padx=20, pady=10)
+        self.scrollable_frame.grid(row=2, column=0, sticky="nsew", padx=20, pady=10)
         self.scrollable_frame.grid_columnconfigure(0, weight=1)
 
-        # Load and display comments
-        self.load_comments()
+    def connect(self) -> bool:
+        if self.db is None:
+            try:
+                self.db = Database(self.events)
+            except Exception as e:
+                self.status_label.configure(text=f"Database unreachable: {e}")
+                return False
+        return True
+
+    def start_scan(self):
+        if self.scanner and self.scanner.is_alive():
+            return
+        if not self.connect():
+            return
+        self.scanner = DuplicateScanner(threshold=int(os.getenv('DUPLICATE_HASH_THRESHOLD', 6)))
+        self.scanner.start()
+        self.scan_button.configure(state="disabled")
+        self.poll_scan()
+
+    def poll_scan(self):
+        if self.scanner.is_alive():
+            self.status_label.configure(text=f"Hashing new photos... {self.scanner.hashed} done")
+            self.after(500, self.poll_scan)
+            return
+
+        self.scan_button.configure(state="normal")
+        if self.scanner.error:
+            self.status_label.configure(text=f"Scan failed: {self.scanner.error}")
+            return
+        self.clusters = self.scanner.clusters
+        self.index = self.scanner.index  # Kept for delete_cluster while a new scan runs
+        self.load_clusters()
+
+    def load_clusters(self):
+        shown = self.clusters[:self.MAX_CLUSTERS]
+        photos = {photo.id: photo for photo in self.db.get_photos_by_ids([i for c in shown for i in c])}
+        self.status_label.configure(text=f"{len(self.clusters)} groups of near-identical photos")
 
-    def load_comments(self):
-        comments = self.db.get_all_comments()
-        
         # Clear existing widgets
         for widget in self.scrollable_frame.winfo_children():
             widget.destroy()
 
-        # Create comment cards
-        for i, comment in enumerate(comments):
-            comment_card = CommentCard(
-                self.scrollable_frame,
-                comment=comment,
-                on_delete_callback=self.delete_comment
-            )
-            comment_card.grid(row=i, column=0, pady=(0,10), sticky="ew")
+        # Create one block per cluster, oldest photo first
+        for i, cluster in enumerate(shown):
+            members = sorted((photos[photo_id] for photo_id in cluster if photo_id in photos),
+                             key=lambda photo: photo.created_at)
+            if len(members) < 2:
+                continue
+
+            cluster_frame = ctk.CTkFrame(self.scrollable_frame)
+            cluster_frame.grid(row=i, column=0, pady=(0,20), sticky="ew")
+            cluster_frame.grid_columnconfigure(0, weight=1)
+
+            ctk.CTkLabel(cluster_frame, text=f"{len(members)} near-identical photos",
+                        font=("Arial", 16, "bold")).grid(row=0, column=0, padx=10, pady=10, sticky="w")
+            ctk.CTkButton(
+                cluster_frame, text="Delete Copies (keep oldest)",
+                fg_color="red", hover_color="darkred",
+                command=lambda members=members: self.delete_cluster(members)
+            ).grid(row=0, column=0, padx=10, pady=10, sticky="e")
 
-    def delete_comment(self, comment_id: int):
+            for j, photo in enumerate(members):
+                PhotoCard(
+                    cluster_frame,
+                    photo=photo,
+                    on_delete_callback=self.delete_photo
+                ).grid(row=j + 1, column=0, padx=10, pady=(0,10), sticky="ew")
+
+    def invalidate(self):
+        if not self.clusters:
+            return
+        # Hidden tabs wait until they are shown again
+        if self.winfo_ismapped():
+            self.refresh()
+        else:
+            self.stale = True
+
+    def on_show(self):
+        if self.stale:
+            self.stale = False
+            self.refresh()
+
+    def refresh(self):
+        try:
+            live = set(self.db.get_photo_ids())
+        except Exception as e:
+            print(f"Error refreshing duplicate groups: {e}")
+            return
+        self.forget_photos([photo_id for cluster in self.clusters for photo_id in cluster if photo_id not in live])
+
+    def delete_cluster(self, members):
+        # Clusters chain matches: only delete the photos close to the one kept
+        threshold = int(os.getenv('DUPLICATE_HASH_THRESHOLD', 6))
+        copies = self.index.within(members[0].id, [photo.id for photo in members[1:]], threshold)
+        if not copies:
+            messagebox.showinfo("Delete Copies", "No photo in this group is close enough to the oldest one")
+            return
+        kept = len(members) - 1 - len(copies)
+        message = f"Delete {len(copies)} copies and keep the photo posted first by {members[0].username}?"
+        if kept:
+            message += f"\n\n{kept} other photos of the group are not close enough to it and are kept."
+        if not messagebox.askokcancel("Delete Copies", message):
+            return
         try:
-            self.db.delete_comment(comment_id)
-            self.load_comments()  # Refresh the list
+            self.db.delete_photos(copies)
+            self.forget_photos(copies)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to delete photos: {str(e)}")
+
+    def delete_photo(self, photo_id: int):
+        if self.db is None:
+            raise ConnectionError("The database is unreachable, the offline snapshot is read-only")
+        try:
+            self.db.delete_photo(photo_id, undoable=False)
+            self.forget_photos([photo_id])
         except Exception as e:
             raise e
 
-class PhotoManagementFrame(ctk.CTkFrame):
-    def __init__(self, master, **kwargs):
+    def forget_photos(self, photo_ids):
+        removed = set(photo_ids)
+        self.clusters = [kept for kept in ([i for i in c if i not in removed] for c in self.clusters)
+                         if len(kept) > 1]
+        self.load_clusters()  # Refresh the list
+
+class SpamCommentsFrame(ctk.CTkFrame):
+    MAX_CLUSTERS = 20
+    SAMPLE_SIZE = 50  # Comments fetched per displayed cluster
+
+    def __init__(self, master, events, **kwargs):
         super().__init__(master, **kwargs)
-        self.db = Database()
+        self.events = events
+        self.db = None
+        self.analyzer = None
+        self.clusters = []
+
+        # Comments deleted anywhere (also with their photo or user) must leave the clusters
+        self.stale = False
+        self.events.subscribe(('user', 'photo', 'comment'), self.invalidate)
 
         # Configure grid
         self.grid_columnconfigure(0, weight=1)
-        self.grid_rowconfigure(1, weight=1)
+        self.grid_rowconfigure(2, weight=1)
 
         # Add title
         self.title = ctk.CTkLabel(
-            self, text="Photo Management",
+            self, text="Spam Comments",
             font=ctk.CTkFont(size=24, weight="bold")
         )
         self.title.grid(row=0, column=0, padx=20, pady=(20,10))
 
-        # Create scrollable frame for photo cards
+        self.analyze_button = ctk.CTkButton(
+            self, text="Analyze Comments", width=160,
+            command=self.start_analysis
+        )
+        self.analyze_button.grid(row=0, column=0, padx=20, pady=(20,10), sticky="e")
+
+        self.status_label = ctk.CTkLabel(self, text="Analyze to find waves of near-identical comments")
+        self.status_label.grid(row=1, column=0, padx=20)
+
+        # Create scrollable frame for comment clusters
         self.scrollable_frame = ctk.CTkScrollableFrame(self)
-        self.scrollable_frame.grid(row=1, column=0, sticky="nsew", padx=20, pady=10)
+        self.scrollable_frame.grid(row=2, column=0, sticky="nsew", padx=20, pady=10)
         self.scrollable_frame.grid_columnconfigure(0, weight=1)
 
-        # Load and display photos
-        self.load_photos()
+    def connect(self) -> bool:
+        if self.db is None:
+            try:
+                self.db = Database(self.events)
+            except Exception as e:
+                self.status_label.configure(text=f"Database unreachable: {e}")
+                return False
+        return True
+
+    def start_analysis(self):
+        if self.analyzer and self.analyzer.is_alive():
+            return
+        if not self.connect():
+            return
+        self.analyzer = SpamAnalyzer(min_cluster_size=int(os.getenv('SPAM_MIN_CLUSTER_SIZE', 3)))
+        self.analyzer.start()
+        self.analyze_button.configure(state="disabled")
+        self.poll_analysis()
+
+    def poll_analysis(self):
+        if self.analyzer.is_alive():
+            self.status_label.configure(text=f"Analyzing comments... {self.analyzer.processed} processed")
+            self.after(500, self.poll_analysis)
+            return
+
+        self.analyze_button.configure(state="normal")
+        if self.analyzer.error:
+            self.status_label.configure(text=f"Analysis failed: {self.analyzer.error}")
+            return
+        self.clusters = self.analyzer.clusters
+        self.load_clusters()
+
+    def load_clusters(self):
+        self.status_label.configure(text=f"{len(self.clusters)} clusters of near-identical comments")
 
-    def load_photos(self):
-        photos = self.db.get_latest_photos()
-        
         # Clear existing widgets
         for widget in self.scrollable_frame.winfo_children():
             widget.destroy()
 
-        # Create photo cards
-        for i, photo in enumerate(photos):
-            photo_card = PhotoCard(
-                self.scrollable_frame,
-                photo=photo,
-                on_delete_callback=self.delete_photo
-            )
-            photo_card.grid(row=i, column=0, pady=(0,20), sticky="ew")
+        # Summarize each cluster instead of building a card per comment
+        # Only a sample of each cluster is fetched: a wave can hold tens of thousands of comments
+        shown = self.clusters[:self.MAX_CLUSTERS]
+        samples = self.db.get_comments_by_ids([cid for cluster in shown for cid in cluster[:self.SAMPLE_SIZE]])
+        comments_by_id = {comment.id: comment for comment in samples}
+        for i, cluster in enumerate(shown):
+            comments = [comments_by_id[cid] for cid in cluster[:self.SAMPLE_SIZE] if cid in comments_by_id]
+            if not comments:
+                continue
+            authors = Counter(comment.username for comment in comments)
 
-    def delete_photo(self, photo_id: int):
+            cluster_frame = ctk.CTkFrame(self.scrollable_frame)
+            cluster_frame.grid(row=i, column=0, pady=(0,10), sticky="ew")
+            cluster_frame.grid_columnconfigure(0, weight=1)
+
+            ctk.CTkLabel(cluster_frame, text=f"{len(cluster)} similar comments",
+                        font=("Arial", 14, "bold")).grid(row=0, column=0, padx=10, pady=(10, 5), sticky="w")
+            ctk.CTkLabel(cluster_frame, text=comments[0].content,
+                        wraplength=600, justify="left").grid(row=1, column=0, padx=10, sticky="w")
+            top_authors = ", ".join(f"{name} ({count})" for name, count in authors.most_common(5))
+            ctk.CTkLabel(cluster_frame, text=f"Authors in the first {len(comments)}: {top_authors}",
+                        font=("Arial", 12)).grid(row=2, column=0, padx=10, pady=(5, 10), sticky="w")
+
+            ctk.CTkButton(
+                cluster_frame, text="Delete Cluster",
+                fg_color="red", hover_color="darkred",
+                command=lambda comment_ids=cluster: self.delete_cluster(comment_ids)
+            ).grid(row=0, column=1, rowspan=3, padx=10, pady=10)
+
+    def invalidate(self):
+        if not self.clusters:
+            return
+        # Hidden tabs wait until they are shown again
+        if self.winfo_ismapped():
+            self.refresh()
+        else:
+            self.stale = True
+
+    def on_show(self):
+        if self.stale:
+            self.stale = False
+            self.refresh()
+
+    def refresh(self):
         try:
-            self.db.delete_photo(photo_id)
-            self.load_photos()  # Refresh the list
+            live = set(self.db.get_comment_ids())
         except Exception as e:
-            raise e
+            print(f"Error refreshing spam clusters: {e}")
+            return
+        # A wave that was mostly deleted is no longer worth showing
+        self.clusters = [kept for kept in ([cid for cid in cluster if cid in live] for cluster in self.clusters)
+                         if len(kept) >= self.analyzer.min_cluster_size]
+        self.load_clusters()
+
+    def delete_cluster(self, comment_ids):
+        if not messagebox.askokcancel("Delete Cluster",
+                                      f"Are you sure you want to delete these {len(comment_ids)} comments?"):
+            return
+        try:
+            self.db.delete_comments(comment_ids)
+            removed = set(comment_ids)
+            self.clusters = [c for c in self.clusters if not removed.issuperset(c)]
+            self.load_clusters()  # Refresh the list
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to delete comments: {str(e)}")
 
 class FilmDevelopmentFrame(ctk.CTkFrame):
     def __init__(self, master, **kwargs):
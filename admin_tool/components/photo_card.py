@@ -1,32 +1,25 @@
 import customtkinter as ctk
-from PIL import Image, ImageTk
-import requests
-from io import BytesIO
 import tkinter.messagebox as messagebox
 
+from ..services import get_image_loader
 from ..models import Photo
+from .image_owner import ImageOwnerMixin
 
-class PhotoCard(ctk.CTkFrame):
+class PhotoCard(ImageOwnerMixin, ctk.CTkFrame):
     def __init__(self, master, photo: Photo, on_delete_callback, **kwargs):
         super().__init__(master, **kwargs)
         self.photo = photo
         self.on_delete = on_delete_callback
+        self.images = []  # Decoded thumbnails, released in destroy()
         
         self.grid_columnconfigure(1, weight=1)
         self.create_widgets()
         
     def create_widgets(self):
-        # Photo thumbnail
-        try:
-            response = requests.get(self.photo.url)
-            img = Image.open(BytesIO(response.content))
-            img.thumbnail((200, 200))
-            photo_img = ctk.CTkImage(light_image=img, dark_image=img, size=(200, 200))
-            img_label = ctk.CTkLabel(self, image=photo_img, text="")
-        except:
-            img_label = ctk.CTkLabel(self, text="Photo\nNot Available", width=200, height=200)
-        
-        img_label.grid(row=0, column=0, padx=10, pady=10)
+        # Photo thumbnail, filled in by the loader so a slow image host never blocks the UI
+        self.img_label = ctk.CTkLabel(self, text="Loading...", width=200, height=200)
+        self.img_label.grid(row=0, column=0, padx=10, pady=10)
+        get_image_loader().load(self, self.photo.url, self.show_image, size=(200, 200))
 
         # Photo info
         info_frame = ctk.CTkFrame(self)
@@ -69,14 +62,23 @@ class PhotoCard(ctk.CTkFrame):
         )
         delete_button.grid(row=0, column=0, pady=5)
         
+    def show_image(self, img):
+        if img is None:
+            self.img_label.configure(text="Photo\nNot Available")
+            return
+        self.images.append(img)
+        photo_img = ctk.CTkImage(light_image=img, dark_image=img, size=(200, 200))
+        self.img_label.configure(image=photo_img, text="")
+
     def delete_photo(self):
         if messagebox.askokcancel("Delete Photo", 
                                 f"Are you sure you want to delete this photo?\n\n"
-                                "This will permanently delete:\n"
+                                "The background purge will permanently delete:\n"
                                 "• The photo\n"
                                 "• All its comments\n"
                                 "• All its likes\n\n"
-                                "This action cannot be undone!"):
+                                "Until then it is only hidden in the admin tool, not on the site. "
+                                "It can be undone until you delete another photo or close the tool."):
             try:
                 self.on_delete(self.photo.id)
                 messagebox.showinfo("Success", "Photo has been deleted successfully")
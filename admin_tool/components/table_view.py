@@ -0,0 +1,98 @@
+from typing import Callable, List, NamedTuple
+import customtkinter as ctk
+import tkinter.messagebox as messagebox
+import tkinter.ttk as ttk
+
+class Column(NamedTuple):
+    key: str  # Model field, also the sort key passed to fetch_page
+    heading: str
+    width: int
+    value: Callable
+
+class ListingTable(ctk.CTkFrame):
+    """Dense alternative to a list of cards: one Treeview row per entity.
+
+    Sorting is done by `fetch_page(sort_key, descending, limit, offset)`, so
+    the snapshot store orders the whole listing rather than just the loaded rows.
+    Only the selected row gets a full card, built by `make_card(master, item)`
+    in the detail pane below the table.
+    """
+
+    def __init__(self, master, columns: List[Column], fetch_page, make_card, page_size: int = 500, **kwargs):
+        super().__init__(master, **kwargs)
+        self.columns = {column.key: column for column in columns}
+        self.fetch_page = fetch_page
+        self.make_card = make_card
+        self.page_size = page_size
+        self.sort_key = 'created_at'
+        self.descending = True
+        self.items = {}
+        self.detail_card = None
+
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(0, weight=1)
+
+        self.tree = ttk.Treeview(self, columns=list(self.columns), show="headings", selectmode="browse")
+        for column in columns:
+            self.tree.heading(column.key, text=column.heading, command=lambda key=column.key: self.sort_by(key))
+            self.tree.column(column.key, width=column.width, stretch=column.width > 150)
+        self.tree.grid(row=0, column=0, sticky="nsew")
+        self.tree.bind("<<TreeviewSelect>>", self.on_select)
+
+        scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.tree.yview)
+        scrollbar.grid(row=0, column=1, sticky="ns")
+        self.tree.configure(yscrollcommand=scrollbar.set)
+
+        self.more_button = ctk.CTkButton(self, text="Load More", width=120, command=self.load_more)
+        self.more_button.grid(row=1, column=0, columnspan=2, pady=5)
+
+        self.detail_frame = ctk.CTkFrame(self)
+        self.detail_frame.grid(row=2, column=0, columnspan=2, sticky="ew", pady=(5, 0))
+        self.detail_frame.grid_columnconfigure(0, weight=1)
+
+    def reload(self):
+        self.clear_detail()
+        self.tree.delete(*self.tree.get_children())
+        self.items.clear()
+        self.update_headings()
+        self.load_more()
+
+    def load_more(self):
+        try:
+            page = self.fetch_page(self.sort_key, self.descending, self.page_size, len(self.items))
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to load rows: {str(e)}")
+            return
+        for item in page:
+            if str(item.id) in self.items:
+                continue  # Shifted onto this page by rows added since the last one
+            self.items[str(item.id)] = item
+            self.tree.insert("", "end", iid=str(item.id),
+                             values=[column.value(item) for column in self.columns.values()])
+        self.more_button.configure(state="normal" if len(page) == self.page_size else "disabled")
+
+    def sort_by(self, key: str):
+        if key == self.sort_key:
+            self.descending = not self.descending
+        else:
+            # Dates and counts read best largest first, text from A to Z
+            self.descending = key == 'created_at' or key.endswith('_count')
+        self.sort_key = key
+        self.reload()
+
+    def update_headings(self):
+        for key, column in self.columns.items():
+            arrow = (" ▼" if self.descending else " ▲") if key == self.sort_key else ""
+            self.tree.heading(key, text=column.heading + arrow)
+
+    def on_select(self, event=None):
+        selection = self.tree.selection()
+        self.clear_detail()
+        if selection:
+            self.detail_card = self.make_card(self.detail_frame, self.items[selection[0]])
+            self.detail_card.grid(row=0, column=0, sticky="ew")
+
+    def clear_detail(self):
+        if self.detail_card is not None:
+            self.detail_card.destroy()
+            self.detail_card = None
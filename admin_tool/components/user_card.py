@@ -1,35 +1,25 @@
 import customtkinter as ctk
-from PIL import Image, ImageTk
-import requests
-from io import BytesIO
 import tkinter.messagebox as messagebox
 
+from ..services import get_image_loader
 from ..models import User
+from .image_owner import ImageOwnerMixin
 
-class UserCard(ctk.CTkFrame):
+class UserCard(ImageOwnerMixin, ctk.CTkFrame):
     def __init__(self, master, user: User, on_delete_callback, **kwargs):
         super().__init__(master, **kwargs)
         self.user = user
         self.on_delete = on_delete_callback
+        self.images = []  # Decoded thumbnails, released in destroy()
         
         self.grid_columnconfigure(1, weight=1)
         self.create_widgets()
         
     def create_widgets(self):
-        # Profile image
-        try:
-            if self.user.profile_image:
-                response = requests.get(self.user.profile_image)
-                img = Image.open(BytesIO(response.content))
-                img.thumbnail((100, 100))
-                photo_img = ctk.CTkImage(light_image=img, dark_image=img, size=(100, 100))
-                img_label = ctk.CTkLabel(self, image=photo_img, text="")
-            else:
-                img_label = ctk.CTkLabel(self, text="No\nProfile\nPic", width=100, height=100)
-        except:
-            img_label = ctk.CTkLabel(self, text="No\nProfile\nPic", width=100, height=100)
-        
-        img_label.grid(row=0, column=0, padx=10, pady=10)
+        # Profile image, filled in by the loader so a slow image host never blocks the UI
+        self.img_label = ctk.CTkLabel(self, text="Loading...", width=100, height=100)
+        self.img_label.grid(row=0, column=0, padx=10, pady=10)
+        get_image_loader().load(self, self.user.profile_image, self.show_image, size=(100, 100))
 
         # User info
         info_frame = ctk.CTkFrame(self)
@@ -52,15 +42,24 @@ class UserCard(ctk.CTkFrame):
         )
         delete_button.grid(row=0, column=0, pady=5)
         
+    def show_image(self, img):
+        if img is None:
+            self.img_label.configure(text="No\nProfile\nPic")
+            return
+        self.images.append(img)
+        photo_img = ctk.CTkImage(light_image=img, dark_image=img, size=(100, 100))
+        self.img_label.configure(image=photo_img, text="")
+
     def delete_user(self):
         if messagebox.askokcancel("Delete Account", 
                                 f"Are you sure you want to delete the account for {self.user.username}?\n\n"
-                                "This will permanently delete:\n"
+                                "The background purge will permanently delete:\n"
                                 "• All their photos\n"
                                 "• All their comments\n"
                                 "• All their likes\n"
                                 "• Their profile\n\n"
-                                "This action cannot be undone!"):
+                                "Until then it is only hidden in the admin tool, not on the site. "
+                                "It can be undone until you delete another account or close the tool."):
             try:
                 self.on_delete(self.user.id)
                 messagebox.showinfo("Success", f"Account {self.user.username} has been deleted successfully")
@@ -1,3 +1,7 @@
 from .connection import Database
+from .purge import PurgeWorker
+from .replicas import ReplicaPool, get_replica_pool
+from .snapshot import SnapshotStore
+from .async_connection import AsyncDatabase
 
-__all__ = ['Database']
+__all__ = ['Database', 'PurgeWorker', 'ReplicaPool', 'get_replica_pool', 'SnapshotStore', 'AsyncDatabase']
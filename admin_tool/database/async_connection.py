@@ -0,0 +1,131 @@
+import asyncio
+import os
+from typing import Dict, List, Optional
+
+import aiomysql
+
+from ..models import User, Comment, Photo
+from .replicas import ReplicaPool
+from .queries import (
+    USER_IDS_QUERY, PHOTO_IDS_QUERY, COMMENT_IDS_QUERY,
+    USER_COUNT_SOURCES, PHOTO_COUNT_SOURCES, count_queries,
+    users_query, photos_query, comments_query, since_clause,
+    user_from_row, photo_from_row, comment_from_row, counts_from_rows
+)
+
+class AsyncDatabase:
+    """Read-only asyncio counterpart of Database for the listing queries.
+
+    Every query borrows its own pooled connection, so listing, id and count
+    queries for all tabs can run at the same time. Like Database._read, reads
+    go to a healthy replica picked by the ReplicaPool unless the caller pins
+    them to the primary after a recent write.
+    """
+
+    def __init__(self, pool):
+        self.pool = pool
+
+    @classmethod
+    async def connect(cls, replicas: Optional[ReplicaPool] = None, use_primary: bool = False,
+                      maxsize: int = 8) -> 'AsyncDatabase':
+        replica = None if use_primary or not replicas else replicas.choose()
+        targets = [(replica.host, replica.port)] if replica else []
+        targets.append((os.getenv('DB_HOST'), os.getenv('DB_PORT')))
+
+        error = None
+        for host, port in targets:
+            try:
+                pool = await aiomysql.create_pool(
+                    host=host,
+                    port=int(port or 3306),
+                    user=os.getenv('DB_USER'),
+                    password=os.getenv('DB_PASSWORD'),
+                    db=os.getenv('DB_NAME'),
+                    autocommit=True,
+                    connect_timeout=float(os.getenv('DB_CONNECT_TIMEOUT', 5)),
+                    minsize=1,
+                    maxsize=maxsize
+                )
+                return cls(pool)
+            except Exception as e:
+                if replica and (host, port) == (replica.host, replica.port):
+                    replicas.mark_unhealthy(replica, e)
+                else:
+                    print(f"Async connection to {host}:{port} failed: {e}")
+                error = e
+        raise error
+
+    async def close(self):
+        self.pool.close()
+        await self.pool.wait_closed()
+
+    async def _read(self, query: str, params: tuple = ()) -> List[dict]:
+        async with self.pool.acquire() as connection:
+            async with connection.cursor(aiomysql.DictCursor) as cursor:
+                await cursor.execute(query, params)
+                return await cursor.fetchall()
+
+    async def _ids(self, query: str) -> List[int]:
+        return [row['id'] for row in await self._read(query)]
+
+    async def _counts(self, queries: Dict[str, tuple]) -> Dict[int, dict]:
+        results = await asyncio.gather(*(self._read(query, params) for query, params in queries.values()))
+        return counts_from_rows(dict(zip(queries, results)))
+
+    @staticmethod
+    def _in_clause(alias: str, ids: List[int]) -> str:
+        return f"AND {alias}.id IN ({', '.join(['%s'] * len(ids))})"
+
+    async def get_all_users(self) -> List[User]:
+        return [user_from_row(row) for row in await self._read(users_query())]
+
+    async def get_users_since(self, created_at, user_id: int) -> List[User]:
+        rows = await self._read(users_query(since_clause('u')), (created_at, created_at, user_id))
+        return [user_from_row(row) for row in rows]
+
+    async def get_users_by_ids(self, user_ids: List[int]) -> List[User]:
+        if not user_ids:
+            return []
+        rows = await self._read(users_query(self._in_clause('u', user_ids)), tuple(user_ids))
+        return [user_from_row(row) for row in rows]
+
+    async def get_user_ids(self) -> List[int]:
+        return await self._ids(USER_IDS_QUERY)
+
+    async def get_user_counts(self, user_ids: Optional[List[int]] = None) -> Dict[int, dict]:
+        return await self._counts(count_queries(USER_COUNT_SOURCES, user_ids))
+
+    async def get_latest_photos(self) -> List[Photo]:
+        return [photo_from_row(row) for row in await self._read(photos_query())]
+
+    async def get_photos_since(self, created_at, photo_id: int) -> List[Photo]:
+        rows = await self._read(photos_query(since_clause('p')), (created_at, created_at, photo_id))
+        return [photo_from_row(row) for row in rows]
+
+    async def get_photos_by_ids(self, photo_ids: List[int]) -> List[Photo]:
+        if not photo_ids:
+            return []
+        rows = await self._read(photos_query(self._in_clause('p', photo_ids)), tuple(photo_ids))
+        return [photo_from_row(row) for row in rows]
+
+    async def get_photo_ids(self) -> List[int]:
+        return await self._ids(PHOTO_IDS_QUERY)
+
+    async def get_photo_counts(self, photo_ids: Optional[List[int]] = None) -> Dict[int, dict]:
+        return await self._counts(count_queries(PHOTO_COUNT_SOURCES, photo_ids))
+
+    async def get_all_comments(self) -> List[Comment]:
+        return [comment_from_row(row) for row in await self._read(comments_query())]
+
+    async def get_comments_since(self, created_at, comment_id: int) -> List[Comment]:
+        rows = await self._read(comments_query(since_clause('c')), (created_at, created_at, comment_id))
+        return [comment_from_row(row) for row in rows]
+
+    async def get_comments_by_ids(self, comment_ids: List[int]) -> List[Comment]:
+        if not comment_ids:
+            return []
+        rows = await self._read(comments_query(self._in_clause('c', comment_ids)), tuple(comment_ids))
+        return [comment_from_row(row) for row in rows]
+
+    async def get_comment_ids(self) -> List[int]:
+        return await self._ids(COMMENT_IDS_QUERY)
@@ -1,188 +1,233 @@
 import mysql.connector
 import os
-from typing import List
-from ..models import User, Comment, Photo
+import time
+from typing import Dict, List, Optional
+from ..models import User, Comment, Photo, PendingDeletion
 from mysql.connector import Error
 import bcrypt
+from .replicas import get_replica_pool
+from .queries import (
+    DELETION_TABLE_DDL, HIDDEN_USER, HIDDEN_PHOTO,
+    USER_IDS_QUERY, PHOTO_IDS_QUERY, COMMENT_IDS_QUERY,
+    USER_COUNT_SOURCES, PHOTO_COUNT_SOURCES, count_queries,
+    users_query, photos_query, comments_query, since_clause,
+    user_from_row, photo_from_row, comment_from_row, counts_from_rows
+)
 
 class Database:
-    def __init__(self):
+    # The AdminDeletion table is created by the first connection of the process
+    # (normally the login), not by every scanner and worker connection
+    _schema_ready = False
+
+    def __init__(self, events=None):
         try:
             self.connection = mysql.connector.connect(
                 host=os.getenv('DB_HOST'),
                 port=int(os.getenv('DB_PORT')),
                 user=os.getenv('DB_USER'),
                 password=os.getenv('DB_PASSWORD'),
-                database=os.getenv('DB_NAME')
+                database=os.getenv('DB_NAME'),
+                # Login and offline tabs connect on the Tk thread: an unreachable host
+                # must fail over to the snapshot quickly, not after the OS TCP timeout
+                connection_timeout=int(os.getenv('DB_CONNECT_TIMEOUT', 5)),
+                # Reads must see other sessions' writes, not the snapshot of an
+                # implicit REPEATABLE READ transaction left open since the last commit
+                autocommit=True
             )
             self.cursor = self.connection.cursor(dictionary=True)
+            if not Database._schema_ready:
+                self.cursor.execute(DELETION_TABLE_DDL)
+                Database._schema_ready = True
         except Error as e:
             print(f"Error connecting to MySQL: {e}")
             raise e
 
+        # Listing, search and aggregate queries go to replicas when configured.
+        # After a write, reads stay on the primary for a short window so the
+        # admin never sees a row they just deleted come back from a lagging replica.
+        self.replicas = get_replica_pool()
+        self.read_your_writes_window = float(os.getenv('DB_READ_YOUR_WRITES_WINDOW', 5))
+        self._primary_pinned_until = 0.0
+
+        # Writes are published here (an InvalidationBus) so every tab showing
+        # the changed rows or their counts can refresh, not just the one that wrote
+        self.events = events
+
     def get_all_users(self) -> List[User]:
-        query = """
-        SELECT 
-            u.id,
-            u.username,
-            u.email,
-            u.profileImage,
-            u.createdAt,
-            COUNT(DISTINCT c.id) as comment_count,
-            COUNT(DISTINCT l.id) as like_count,
-            COUNT(DISTINCT p.id) as photo_count
-        FROM User u
-        LEFT JOIN Comment c ON c.userId = u.id
-        LEFT JOIN `Like` l ON l.userId = u.id
-        LEFT JOIN Photo p ON p.userId = u.id
-        GROUP BY u.id
-        ORDER BY u.createdAt DESC
-        """
-        self.cursor.execute(query)
-        users_data = self.cursor.fetchall()
-        
-        return [User(
-            id=user['id'],
-            username=user['username'],
-            email=user['email'],
-            profile_image=user['profileImage'],
-            created_at=user['createdAt'],
-            comment_count=user['comment_count'],
-            like_count=user['like_count'],
-            photo_count=user['photo_count']
-        ) for user in users_data]
-
-    def delete_user(self, user_id: int) -> None:
-        """Delete a user and all their associated data."""
-        try:
-            # Start transaction
-            self.connection.start_transaction()
-            
-            # Delete user's likes
-            self.cursor.execute("DELETE FROM `Like` WHERE userId = %s", (user_id,))
-            
-            # Delete user's comments
-            self.cursor.execute("DELETE FROM Comment WHERE userId = %s", (user_id,))
-            
-            # Get user's photos
-            self.cursor.execute("SELECT id FROM Photo WHERE userId = %s", (user_id,))
-            photos = self.cursor.fetchall()
-            
-            # Delete likes and comments on user's photos
-            for photo in photos:
-                self.cursor.execute("DELETE FROM `Like` WHERE photoId = %s", (photo['id'],))
-                self.cursor.execute("DELETE FROM Comment WHERE photoId = %s", (photo['id'],))
-            
-            # Delete user's photos
-            self.cursor.execute("DELETE FROM Photo WHERE userId = %s", (user_id,))
-            
-            # Finally, delete the user
-            self.cursor.execute("DELETE FROM User WHERE id = %s", (user_id,))
-            
-            # Commit transaction
-            self.connection.commit()
-            
-        except Exception as e:
-            self.connection.rollback()
-            raise e
+        return self._fetch_users()
+
+    def get_users_since(self, created_at, user_id: int) -> List[User]:
+        """Users created after the (createdAt, id) watermark, for incremental syncs."""
+        return self._fetch_users(since_clause('u'), (created_at, created_at, user_id))
+
+    def get_users_by_ids(self, user_ids: List[int]) -> List[User]:
+        if not user_ids:
+            return []
+        placeholders = ", ".join(["%s"] * len(user_ids))
+        return self._fetch_users(f"AND u.id IN ({placeholders})", tuple(user_ids))
+
+    def get_user_ids(self) -> List[int]:
+        """Ids of all visible users."""
+        return [row['id'] for row in self._read(USER_IDS_QUERY)]
+
+    def get_user_counts(self, user_ids: Optional[List[int]] = None) -> Dict[int, dict]:
+        """Activity counts per user (or only `user_ids`), from one cheap GROUP BY per table instead of the listing join."""
+        return self._counts(count_queries(USER_COUNT_SOURCES, user_ids))
+
+    def _fetch_users(self, extra_where: str = "", params: tuple = (),
+                     order_by: str = "ORDER BY u.createdAt DESC") -> List[User]:
+        return [user_from_row(row) for row in self._read(users_query(extra_where, order_by), params)]
+
+    def delete_user(self, user_id: int, undoable: bool = True) -> None:
+        """Hide a user and everything they own; rows are purged in the background."""
+        self._soft_delete('user', user_id, undoable)
+
+    def release_user(self, user_id: int) -> None:
+        """Give up the undo of a user delete so the purge starts right away."""
+        self._release('user', user_id)
+
+    def restore_user(self, user_id: int) -> bool:
+        """Undo a soft delete. Returns False once the purge has started."""
+        return self._restore('user', user_id)
 
     def get_latest_photos(self) -> List[Photo]:
-        query = """
-        SELECT 
-            p.id,
-            p.url,
-            p.title,
-            p.createdAt,
-            p.userId,
-            u.username,
-            u.email,
-            COUNT(DISTINCT l.id) as like_count,
-            COUNT(DISTINCT c.id) as comment_count
-        FROM Photo p
-        JOIN User u ON p.userId = u.id
-        LEFT JOIN `Like` l ON l.photoId = p.id
-        LEFT JOIN Comment c ON c.photoId = p.id
-        GROUP BY p.id, p.url, p.title, p.createdAt, p.userId, u.username, u.email
-        ORDER BY p.createdAt DESC
-        """
-        self.cursor.execute(query)
-        photos_data = self.cursor.fetchall()
-        
-        return [Photo(
-            id=photo['id'],
-            url=photo['url'],
-            title=photo['title'],
-            created_at=photo['createdAt'],
-            user_id=photo['userId'],
-            username=photo['username'],
-            email=photo['email'],
-            like_count=photo['like_count'],
-            comment_count=photo['comment_count']
-        ) for photo in photos_data]
-
-    def delete_photo(self, photo_id: int) -> None:
-        """Delete a photo and all its associated data."""
+        return self._fetch_photos()
+
+    def get_photos_by_ids(self, photo_ids: List[int]) -> List[Photo]:
+        if not photo_ids:
+            return []
+        placeholders = ", ".join(["%s"] * len(photo_ids))
+        return self._fetch_photos(f"AND p.id IN ({placeholders})", tuple(photo_ids))
+
+    def get_photos_since(self, created_at, photo_id: int) -> List[Photo]:
+        """Photos created after the (createdAt, id) watermark, for incremental syncs."""
+        return self._fetch_photos(since_clause('p'), (created_at, created_at, photo_id))
+
+    def get_photo_counts(self, photo_ids: Optional[List[int]] = None) -> Dict[int, dict]:
+        """Like and comment counts per photo (or only `photo_ids`), from one cheap GROUP BY per table."""
+        return self._counts(count_queries(PHOTO_COUNT_SOURCES, photo_ids))
+
+    def get_photo_ids(self) -> List[int]:
+        """Ids of all visible photos."""
+        return [row['id'] for row in self._read(PHOTO_IDS_QUERY)]
+
+    def get_stored_photo_ids(self) -> List[int]:
+        """Ids of every photo row, including soft-deleted ones that may still be restored."""
+        return [row['id'] for row in self._read("SELECT id FROM Photo")]
+
+    def get_photo_urls_after(self, photo_id: int, limit: int) -> List[tuple]:
+        """Next batch of (id, url) pairs in id order, for incremental background jobs."""
+        rows = self._read(
+            "SELECT id, url FROM Photo WHERE id > %s ORDER BY id LIMIT %s",
+            (photo_id, limit)
+        )
+        return [(row['id'], row['url']) for row in rows]
+
+    def get_photo_urls(self, photo_ids: List[int]) -> List[tuple]:
+        """(id, url) pairs for the given photos, e.g. to retry ones whose image failed to load."""
+        if not photo_ids:
+            return []
+        placeholders = ", ".join(["%s"] * len(photo_ids))
+        rows = self._read(f"SELECT id, url FROM Photo WHERE id IN ({placeholders}) ORDER BY id", tuple(photo_ids))
+        return [(row['id'], row['url']) for row in rows]
+
+    def _fetch_photos(self, extra_where: str = "", params: tuple = (),
+                      order_by: str = "ORDER BY p.createdAt DESC") -> List[Photo]:
+        return [photo_from_row(row) for row in self._read(photos_query(extra_where, order_by), params)]
+
+    def delete_photo(self, photo_id: int, undoable: bool = True) -> None:
+        """Hide a photo with its likes and comments; rows are purged in the background."""
+        self._soft_delete('photo', photo_id, undoable)
+
+    def release_photo(self, photo_id: int) -> None:
+        """Give up the undo of a photo delete so the purge starts right away."""
+        self._release('photo', photo_id)
+
+    def delete_photos(self, photo_ids: List[int]) -> None:
+        """Delete several photos at once, e.g. a cluster of duplicates; there is no undo."""
         try:
-            # Start transaction
-            self.connection.start_transaction()
-            
-            # Delete likes and comments
-            self.cursor.execute("DELETE FROM `Like` WHERE photoId = %s", (photo_id,))
-            self.cursor.execute("DELETE FROM Comment WHERE photoId = %s", (photo_id,))
-            
-            # Delete the photo
-            self.cursor.execute("DELETE FROM Photo WHERE id = %s", (photo_id,))
-            
-            # Commit transaction
+            self.cursor.executemany(
+                "INSERT IGNORE INTO AdminDeletion (entityType, entityId, status) VALUES ('photo', %s, 'released')",
+                [(photo_id,) for photo_id in photo_ids]
+            )
             self.connection.commit()
+            self._after_write('photo')
         except Exception as e:
             self.connection.rollback()
             raise e
 
+    def restore_photo(self, photo_id: int) -> bool:
+        """Undo a soft delete. Returns False once the purge has started."""
+        return self._restore('photo', photo_id)
+
     def get_all_comments(self) -> List[Comment]:
-        query = """
-        SELECT 
-            c.id,
-            c.content,
-            c.createdAt,
-            c.userId,
-            c.photoId,
-            u.username,
-            u.profileImage as user_profile_image,
-            p.url as photo_url,
-            p.title as photo_title
-        FROM Comment c
-        JOIN User u ON c.userId = u.id
-        JOIN Photo p ON c.photoId = p.id
-        ORDER BY c.createdAt DESC
-        """
-        self.cursor.execute(query)
-        comments_data = self.cursor.fetchall()
-        
-        return [Comment(
-            id=comment['id'],
-            content=comment['content'],
-            created_at=comment['createdAt'],
-            user_id=comment['userId'],
-            photo_id=comment['photoId'],
-            username=comment['username'],
-            user_profile_image=comment['user_profile_image'],
-            photo_url=comment['photo_url'],
-            photo_title=comment['photo_title']
-        ) for comment in comments_data]
+        return self._fetch_comments()
+
+    def get_comments_by_ids(self, comment_ids: List[int]) -> List[Comment]:
+        if not comment_ids:
+            return []
+        placeholders = ", ".join(["%s"] * len(comment_ids))
+        return self._fetch_comments(f"AND c.id IN ({placeholders})", tuple(comment_ids))
+
+    def get_comments_since(self, created_at, comment_id: int) -> List[Comment]:
+        """Comments created after the (createdAt, id) watermark, for incremental syncs."""
+        return self._fetch_comments(since_clause('c'), (created_at, created_at, comment_id))
+
+    def get_comment_ids(self) -> List[int]:
+        """Ids of all visible comments."""
+        return [row['id'] for row in self._read(COMMENT_IDS_QUERY)]
+
+    def iter_comment_texts(self, batch_size: int = 5000):
+        """Stream (id, content) for visible comments in id order, one batch in memory at a time."""
+        last_id = 0
+        while True:
+            rows = self._read("""
+            SELECT c.id, c.content
+            FROM Comment c
+            JOIN Photo p ON c.photoId = p.id
+            WHERE c.id > %s
+                AND NOT EXISTS (""" + HIDDEN_USER.format('c.userId') + """)
+                AND NOT EXISTS (""" + HIDDEN_PHOTO.format('c.photoId') + """)
+                AND NOT EXISTS (""" + HIDDEN_USER.format('p.userId') + """)
+            ORDER BY c.id
+            LIMIT %s
+            """, (last_id, batch_size))
+            if not rows:
+                return
+            for row in rows:
+                yield row['id'], row['content']
+            last_id = rows[-1]['id']
+
+    def _fetch_comments(self, extra_where: str = "", params: tuple = (),
+                        order_by: str = "ORDER BY c.createdAt DESC") -> List[Comment]:
+        return [comment_from_row(row) for row in self._read(comments_query(extra_where, order_by), params)]
 
     def delete_comment(self, comment_id: int) -> None:
         """Delete a comment."""
         try:
             self.cursor.execute("DELETE FROM Comment WHERE id = %s", (comment_id,))
             self.connection.commit()
+            self._after_write('comment')
         except Exception as e:
             self.connection.rollback()
             raise e
 
+    def delete_comments(self, comment_ids: List[int], chunk_size: int = 500) -> None:
+        """Delete many comments, one short transaction per chunk."""
+        for start in range(0, len(comment_ids), chunk_size):
+            chunk = comment_ids[start:start + chunk_size]
+            placeholders = ", ".join(["%s"] * len(chunk))
+            try:
+                self.cursor.execute(f"DELETE FROM Comment WHERE id IN ({placeholders})", tuple(chunk))
+                self.connection.commit()
+                self._after_write('comment')
+            except Exception as e:
+                self.connection.rollback()
+                raise e
+
     def verify_user_login(self, email: str, password: str) -> User:
         try:
-            query = "SELECT * FROM User WHERE email = %s"
+            query = "SELECT * FROM User u WHERE email = %s AND NOT EXISTS (" + HIDDEN_USER.format('u.id') + ")"
             self.cursor.execute(query, (email,))
             user_data = self.cursor.fetchone()
 
@@ -204,6 +249,111 @@ class Database:
             print(f"Database error: {e}")
             raise e
 
+    def _soft_delete(self, entity_type: str, entity_id: int, undoable: bool) -> None:
+        try:
+            self.cursor.execute(
+                "INSERT IGNORE INTO AdminDeletion (entityType, entityId, status) VALUES (%s, %s, %s)",
+                (entity_type, entity_id, 'pending' if undoable else 'released')
+            )
+            self.connection.commit()
+            self._after_write(entity_type)
+        except Exception as e:
+            self.connection.rollback()
+            raise e
+
+    def _restore(self, entity_type: str, entity_id: int) -> bool:
+        try:
+            self.cursor.execute(
+                "DELETE FROM AdminDeletion WHERE entityType = %s AND entityId = %s AND status = 'pending'",
+                (entity_type, entity_id)
+            )
+            restored = self.cursor.rowcount > 0
+            self.connection.commit()
+            if restored:
+                self._after_write(entity_type)
+            return restored
+        except Exception as e:
+            self.connection.rollback()
+            raise e
+
+    def _release(self, entity_type: str, entity_id: int) -> None:
+        self.cursor.execute(
+            "UPDATE AdminDeletion SET status = 'released' WHERE entityType = %s AND entityId = %s AND status = 'pending'",
+            (entity_type, entity_id)
+        )
+        self.connection.commit()
+
+    def claim_next_deletion(self, grace_period: int) -> Optional[PendingDeletion]:
+        """Pick the next soft delete to purge, resuming any purge interrupted by a crash."""
+        try:
+            self.cursor.execute("""
+            SELECT * FROM AdminDeletion
+            WHERE status IN ('purging', 'released')
+                OR (status = 'pending' AND requestedAt <= NOW() - INTERVAL %s SECOND)
+            ORDER BY status = 'purging' DESC, status = 'released' DESC, requestedAt
+            LIMIT 1
+            """, (grace_period,))
+            row = self.cursor.fetchone()
+            if not row:
+                self.connection.commit()
+                return None
+
+            if row['status'] != 'purging':
+                # Conditional update so a concurrent restore wins over the claim
+                self.cursor.execute(
+                    "UPDATE AdminDeletion SET status = 'purging' WHERE id = %s AND status = %s",
+                    (row['id'], row['status'])
+                )
+                claimed = self.cursor.rowcount > 0
+                self.connection.commit()
+                if not claimed:
+                    return None
+                row['status'] = 'purging'
+            else:
+                self.connection.commit()
+            return self._deletion_from_row(row)
+        except Exception as e:
+            self.connection.rollback()
+            raise e
+
+    def _read(self, query: str, params: tuple = ()) -> List[dict]:
+        """Run a read-only query on a healthy replica, falling back to the primary."""
+        pinned = time.monotonic() < self._primary_pinned_until or (
+            # Another tab's connection may have just written what this one is about to read
+            self.events is not None and self.events.published_within(self.read_your_writes_window)
+        )
+        replica = None if pinned else self.replicas.choose()
+        if replica:
+            try:
+                cursor = replica.cursor()
+                cursor.execute(query, params)
+                return cursor.fetchall()
+            except Error as e:
+                self.replicas.mark_unhealthy(replica, e)
+        self.cursor.execute(query, params)
+        return self.cursor.fetchall()
+
+    def _counts(self, queries: Dict[str, tuple]) -> Dict[int, dict]:
+        return counts_from_rows({key: self._read(query, params) for key, (query, params) in queries.items()})
+
+    def _after_write(self, entity_type: str):
+        self._primary_pinned_until = time.monotonic() + self.read_your_writes_window
+        if self.events is not None:
+            self.events.publish(entity_type)
+
+    def _deletion_from_row(self, row) -> PendingDeletion:
+        return PendingDeletion(
+            id=row['id'],
+            entity_type=row['entityType'],
+            entity_id=row['entityId'],
+            status=row['status'],
+            requested_at=row['requestedAt'],
+            purged_rows=row['purgedRows'],
+            updated_at=row['updatedAt']
+        )
+
     def __del__(self):
-        self.cursor.close()
-        self.connection.close() 
\ No newline at end of file
+        # The replica pool is shared by the process and outlives this connection
+        if hasattr(self, 'cursor'):  # Not when the connection itself failed
+            self.cursor.close()
+            self.connection.close() 
\ No newline at end of file
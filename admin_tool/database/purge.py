@@ -0,0 +1,149 @@
+import argparse
+import os
+import signal
+import threading
+import time
+from typing import Optional
+
+from dotenv import load_dotenv
+from mysql.connector import Error
+
+from .connection import Database
+from ..models import PendingDeletion
+
+# Each step deletes at most `chunk_size` rows per transaction, children first so
+# foreign keys never block. Steps are idempotent, which is what makes a purge
+# resumable: after a crash the same steps simply run again.
+USER_PURGE_STEPS = [
+    "DELETE FROM `Like` WHERE userId = %(id)s LIMIT %(limit)s",
+    "DELETE FROM Comment WHERE userId = %(id)s LIMIT %(limit)s",
+    "DELETE FROM `Like` WHERE photoId IN (SELECT id FROM Photo WHERE userId = %(id)s) LIMIT %(limit)s",
+    "DELETE FROM Comment WHERE photoId IN (SELECT id FROM Photo WHERE userId = %(id)s) LIMIT %(limit)s",
+    "DELETE FROM Photo WHERE userId = %(id)s LIMIT %(limit)s",
+    "DELETE FROM User WHERE id = %(id)s",
+]
+
+PHOTO_PURGE_STEPS = [
+    "DELETE FROM `Like` WHERE photoId = %(id)s LIMIT %(limit)s",
+    "DELETE FROM Comment WHERE photoId = %(id)s LIMIT %(limit)s",
+    "DELETE FROM Photo WHERE id = %(id)s",
+]
+
+PURGE_STEPS = {
+    'user': USER_PURGE_STEPS,
+    'photo': PHOTO_PURGE_STEPS,
+}
+
+class PurgeWorker(threading.Thread):
+    """Background thread that physically removes soft-deleted users and photos.
+
+    Uses its own connection: mysql-connector connections are not thread safe.
+    The admin tool runs one while it is open and drains it on close; to purge
+    without the GUI, e.g. as a service next to the web app, run:
+
+        python -m admin_tool.database.purge [--once]
+    """
+
+    def __init__(self):
+        super().__init__(daemon=True)
+        self.chunk_size = int(os.getenv('PURGE_CHUNK_SIZE', 500))
+        self.chunk_delay = float(os.getenv('PURGE_CHUNK_DELAY', 0.2))
+        self.grace_period = int(os.getenv('PURGE_GRACE_PERIOD', 300))
+        self.poll_interval = float(os.getenv('PURGE_POLL_INTERVAL', 10))
+        self.current: Optional[PendingDeletion] = None
+        self.draining = False
+        self._stop_event = threading.Event()
+        self._wake = threading.Event()
+
+    def stop(self):
+        self._stop_event.set()
+        self._wake.set()
+
+    def wake(self):
+        """Look for work now instead of at the next poll, e.g. right after a delete."""
+        self._wake.set()
+
+    def finish(self):
+        """Purge everything that can be claimed now, then exit."""
+        self.draining = True
+        self._wake.set()
+
+    def run(self):
+        db = None
+        while not self._stop_event.is_set():
+            try:
+                if db is None:
+                    db = Database()
+                purged = self.run_once(db)
+            except Error as e:
+                print(f"Purge error: {e}")
+                purged = False
+                if db is not None and not db.connection.is_connected():
+                    # MySQL restarted or dropped us: reconnect on the next poll and
+                    # resume, claim_next_deletion picks up the interrupted purge
+                    db = None
+            except Exception as e:
+                print(f"Purge error: {e}")
+                purged = False
+            if not purged:
+                if self.draining:
+                    break
+                self._wake.wait(self.poll_interval)
+                self._wake.clear()
+
+    def run_once(self, db: Database) -> bool:
+        """Purge the next claimable deletion. Returns False if there was nothing to do."""
+        deletion = db.claim_next_deletion(self.grace_period)
+        if deletion is None:
+            return False
+
+        self.current = deletion
+        for step in PURGE_STEPS[deletion.entity_type]:
+            while not self._stop_event.is_set():
+                deleted = self._purge_chunk(db, deletion, step)
+                if deleted < self.chunk_size:
+                    break
+                # Leave room for the web app's own writes between chunks
+                time.sleep(self.chunk_delay)
+            if self._stop_event.is_set():
+                return True
+
+        db.cursor.execute("DELETE FROM AdminDeletion WHERE id = %s", (deletion.id,))
+        db.connection.commit()
+        self.current = None
+        return True
+
+    def _purge_chunk(self, db: Database, deletion: PendingDeletion, step: str) -> int:
+        try:
+            # The chunk and its progress are recorded together
+            db.connection.start_transaction()
+            db.cursor.execute(step, {'id': deletion.entity_id, 'limit': self.chunk_size})
+            deleted = db.cursor.rowcount
+            db.cursor.execute(
+                "UPDATE AdminDeletion SET purgedRows = purgedRows + %s WHERE id = %s",
+                (deleted, deletion.id)
+            )
+            db.connection.commit()
+        except Exception as e:
+            db.connection.rollback()
+            raise e
+
+        deletion.purged_rows += deleted
+        return deleted
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Purge soft-deleted users and photos without the admin GUI")
+    parser.add_argument('--once', action='store_true', help="exit once nothing is left to claim, e.g. from cron")
+    args = parser.parse_args()
+    load_dotenv()
+    worker = PurgeWorker()
+    worker.draining = args.once
+    # Stop between chunks on Ctrl+C or when the service is stopped; the next run resumes the purge
+    signal.signal(signal.SIGTERM, lambda signum, frame: worker.stop())
+    worker.start()
+    try:
+        while worker.is_alive():
+            worker.join(1)
+    except KeyboardInterrupt:
+        worker.stop()
+        worker.join()
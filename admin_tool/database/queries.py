@@ -0,0 +1,172 @@
+from typing import Dict, List, Optional, Tuple
+
+from ..models import User, Comment, Photo
+
+# Soft-deleted users and photos are recorded here until the background purge
+# (see purge.py) has removed their rows. 'pending' rows can still be undone and
+# wait for the grace period; 'released' ones (no undo offered) are purged first.
+DELETION_TABLE_DDL = """
+CREATE TABLE IF NOT EXISTS AdminDeletion (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    entityType VARCHAR(16) NOT NULL,
+    entityId INT NOT NULL,
+    status VARCHAR(16) NOT NULL DEFAULT 'pending',
+    purgedRows INT NOT NULL DEFAULT 0,
+    requestedAt DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updatedAt DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    UNIQUE KEY entity (entityType, entityId)
+)
+"""
+
+HIDDEN_USER = "SELECT 1 FROM AdminDeletion d WHERE d.entityType = 'user' AND d.entityId = {}"
+HIDDEN_PHOTO = "SELECT 1 FROM AdminDeletion d WHERE d.entityType = 'photo' AND d.entityId = {}"
+
+USER_IDS_QUERY = "SELECT u.id FROM User u WHERE NOT EXISTS (" + HIDDEN_USER.format('u.id') + ")"
+
+PHOTO_IDS_QUERY = (
+    "SELECT p.id FROM Photo p WHERE NOT EXISTS (" + HIDDEN_PHOTO.format('p.id') + ")"
+    " AND NOT EXISTS (" + HIDDEN_USER.format('p.userId') + ")"
+)
+
+COMMENT_IDS_QUERY = """
+SELECT c.id
+FROM Comment c
+JOIN Photo p ON c.photoId = p.id
+WHERE NOT EXISTS (""" + HIDDEN_USER.format('c.userId') + """)
+    AND NOT EXISTS (""" + HIDDEN_PHOTO.format('c.photoId') + """)
+    AND NOT EXISTS (""" + HIDDEN_USER.format('p.userId') + """)
+"""
+
+# Per-table counts: one cheap GROUP BY each instead of the listing join,
+# as (table, column the count is grouped by)
+USER_COUNT_SOURCES = {
+    'photo_count': ('Photo', 'userId'),
+    'comment_count': ('Comment', 'userId'),
+    'like_count': ('`Like`', 'userId'),
+}
+
+PHOTO_COUNT_SOURCES = {
+    'like_count': ('`Like`', 'photoId'),
+    'comment_count': ('Comment', 'photoId'),
+}
+
+def count_queries(sources: Dict[str, Tuple[str, str]], ids: Optional[List[int]] = None) -> Dict[str, Tuple[str, tuple]]:
+    """(query, params) per count, over every row or, through the foreign key index, only `ids`."""
+    queries = {}
+    for key, (table, column) in sources.items():
+        where = f"WHERE {column} IN ({', '.join(['%s'] * len(ids))})" if ids is not None else ""
+        queries[key] = (f"SELECT {column} AS id, COUNT(*) AS n FROM {table} {where} GROUP BY {column}",
+                        tuple(ids or ()))
+    return queries
+
+def since_clause(alias: str) -> str:
+    """Rows after a (createdAt, id) watermark; takes (created_at, created_at, id) as params."""
+    return f"AND ({alias}.createdAt > %s OR ({alias}.createdAt = %s AND {alias}.id > %s))"
+
+def counts_from_rows(rows_by_key: Dict[str, List[dict]]) -> Dict[int, dict]:
+    counts: Dict[int, dict] = {}
+    for key, rows in rows_by_key.items():
+        for row in rows:
+            counts.setdefault(row['id'], {})[key] = row['n']
+    return counts
+
+def users_query(extra_where: str = "", order_by: str = "ORDER BY u.createdAt DESC") -> str:
+    return """
+    SELECT 
+        u.id,
+        u.username,
+        u.email,
+        u.profileImage,
+        u.createdAt,
+        COUNT(DISTINCT c.id) as comment_count,
+        COUNT(DISTINCT l.id) as like_count,
+        COUNT(DISTINCT p.id) as photo_count
+    FROM User u
+    LEFT JOIN Comment c ON c.userId = u.id
+    LEFT JOIN `Like` l ON l.userId = u.id
+    LEFT JOIN Photo p ON p.userId = u.id
+    WHERE NOT EXISTS (""" + HIDDEN_USER.format('u.id') + """)
+        """ + extra_where + """
+    GROUP BY u.id
+    """ + order_by
+
+def user_from_row(row) -> User:
+    return User(
+        id=row['id'],
+        username=row['username'],
+        email=row['email'],
+        profile_image=row['profileImage'],
+        created_at=row['createdAt'],
+        comment_count=row['comment_count'],
+        like_count=row['like_count'],
+        photo_count=row['photo_count']
+    )
+
+def photos_query(extra_where: str = "", order_by: str = "ORDER BY p.createdAt DESC") -> str:
+    return """
+    SELECT 
+        p.id,
+        p.url,
+        p.title,
+        p.createdAt,
+        p.userId,
+        u.username,
+        u.email,
+        COUNT(DISTINCT l.id) as like_count,
+        COUNT(DISTINCT c.id) as comment_count
+    FROM Photo p
+    JOIN User u ON p.userId = u.id
+    LEFT JOIN `Like` l ON l.photoId = p.id
+    LEFT JOIN Comment c ON c.photoId = p.id
+    WHERE NOT EXISTS (""" + HIDDEN_PHOTO.format('p.id') + """)
+        AND NOT EXISTS (""" + HIDDEN_USER.format('p.userId') + """)
+        """ + extra_where + """
+    GROUP BY p.id, p.url, p.title, p.createdAt, p.userId, u.username, u.email
+    """ + order_by
+
+def photo_from_row(row) -> Photo:
+    return Photo(
+        id=row['id'],
+        url=row['url'],
+        title=row['title'],
+        created_at=row['createdAt'],
+        user_id=row['userId'],
+        username=row['username'],
+        email=row['email'],
+        like_count=row['like_count'],
+        comment_count=row['comment_count']
+    )
+
+def comments_query(extra_where: str = "", order_by: str = "ORDER BY c.createdAt DESC") -> str:
+    return """
+    SELECT 
+        c.id,
+        c.content,
+        c.createdAt,
+        c.userId,
+        c.photoId,
+        u.username,
+        u.profileImage as user_profile_image,
+        p.url as photo_url,
+        p.title as photo_title
+    FROM Comment c
+    JOIN User u ON c.userId = u.id
+    JOIN Photo p ON c.photoId = p.id
+    WHERE NOT EXISTS (""" + HIDDEN_USER.format('c.userId') + """)
+        AND NOT EXISTS (""" + HIDDEN_PHOTO.format('c.photoId') + """)
+        AND NOT EXISTS (""" + HIDDEN_USER.format('p.userId') + """)
+        """ + extra_where + """
+    """ + order_by
+
+def comment_from_row(row) -> Comment:
+    return Comment(
+        id=row['id'],
+        content=row['content'],
+        created_at=row['createdAt'],
+        user_id=row['userId'],
+        photo_id=row['photoId'],
+        username=row['username'],
+        user_profile_image=row['user_profile_image'],
+        photo_url=row['photo_url'],
+        photo_title=row['photo_title']
+    )
@@ -0,0 +1,179 @@
+import itertools
+import os
+import threading
+from typing import List, Optional
+
+import mysql.connector
+from mysql.connector import Error
+
+class Replica:
+    """One replica: health shared by every thread, one query connection per thread."""
+
+    def __init__(self, host: str, port: int, connect_timeout: int = 2):
+        self.host = host
+        self.port = port
+        self.connect_timeout = connect_timeout
+        self.probe = None  # Separate connection for health checks, used by the checker thread only
+        self.healthy = False
+        self.lag: Optional[int] = None
+        # mysql-connector connections are not thread safe
+        self._local = threading.local()
+        self._connections = []
+        self._lock = threading.Lock()
+
+    def __str__(self):
+        return f"{self.host}:{self.port}"
+
+    def _open(self):
+        return mysql.connector.connect(
+            host=self.host,
+            port=self.port,
+            user=os.getenv('DB_USER'),
+            password=os.getenv('DB_PASSWORD'),
+            database=os.getenv('DB_NAME'),
+            # A dead host fails fast instead of hanging on the OS TCP timeout
+            connection_timeout=self.connect_timeout,
+            # Each read must see the replica's latest state, not a snapshot
+            # held open by an implicit transaction
+            autocommit=True
+        )
+
+    def cursor(self):
+        """The calling thread's query cursor, connecting on first use."""
+        cursor = getattr(self._local, 'cursor', None)
+        if cursor is None:
+            connection = self._open()
+            cursor = connection.cursor(dictionary=True)
+            self._local.connection, self._local.cursor = connection, cursor
+            with self._lock:
+                self._connections.append(connection)
+        return cursor
+
+    def discard(self):
+        """Drop the calling thread's connection after it failed."""
+        connection = getattr(self._local, 'connection', None)
+        self._local.connection = self._local.cursor = None
+        if connection is not None:
+            with self._lock:
+                self._connections.remove(connection)
+            try:
+                connection.close()
+            except Error:
+                pass
+
+    def replication_lag(self) -> Optional[int]:
+        """Seconds behind the primary, or None if replication is not running."""
+        if self.probe is None or not self.probe.is_connected():
+            self.probe = self._open()
+        cursor = self.probe.cursor(dictionary=True)
+        try:
+            for statement in ("SHOW REPLICA STATUS", "SHOW SLAVE STATUS"):
+                try:
+                    cursor.execute(statement)
+                except Error:
+                    continue  # Older MySQL/MariaDB only know the SLAVE spelling
+                status = cursor.fetchone()
+                if not status:
+                    return None
+                lag = status.get('Seconds_Behind_Source', status.get('Seconds_Behind_Master'))
+                return None if lag is None else int(lag)
+            return None
+        finally:
+            cursor.close()
+
+    def close(self):
+        self.healthy = False
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for connection in connections:
+            connection.close()
+        if self.probe:
+            self.probe.close()
+            self.probe = None
+
+class ReplicaPool:
+    """Read replicas picked round-robin among the healthy ones.
+
+    Health and lag are probed on a background thread every `check_interval`
+    seconds, so choose() only reads cached state and never waits on a slow or
+    dead replica. One pool is shared by the whole process (get_replica_pool),
+    so a new connection starts with the health already known.
+    """
+
+    def __init__(self, replicas: List[Replica], max_lag: int = 5, check_interval: float = 10):
+        self.replicas = replicas
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+        self._order = itertools.cycle(replicas)
+        self._stop = threading.Event()
+        self._checker = None
+        if replicas:
+            self._checker = threading.Thread(target=self._check_loop, daemon=True, name="replica-checker")
+            self._checker.start()
+
+    @classmethod
+    def from_env(cls) -> 'ReplicaPool':
+        """Reads DB_REPLICAS as a comma separated list of host:port entries."""
+        timeout = int(os.getenv('DB_REPLICA_CONNECT_TIMEOUT', 2))
+        replicas = []
+        for entry in filter(None, (e.strip() for e in os.getenv('DB_REPLICAS', '').split(','))):
+            host, _, port = entry.partition(':')
+            replicas.append(Replica(host, int(port or 3306), connect_timeout=timeout))
+        return cls(
+            replicas,
+            max_lag=int(os.getenv('DB_REPLICA_MAX_LAG', 5)),
+            check_interval=float(os.getenv('DB_REPLICA_CHECK_INTERVAL', 10))
+        )
+
+    def __bool__(self):
+        return bool(self.replicas)
+
+    def _check_loop(self):
+        while not self._stop.is_set():
+            self.check()
+            self._stop.wait(self.check_interval)
+
+    def check(self):
+        for replica in self.replicas:
+            try:
+                replica.lag = replica.replication_lag()
+                replica.healthy = replica.lag is not None and replica.lag <= self.max_lag
+            except Error as e:
+                print(f"Replica {replica} unavailable: {e}")
+                replica.healthy = False
+                if replica.probe:
+                    replica.probe.close()
+                    replica.probe = None
+
+    def choose(self) -> Optional[Replica]:
+        if self._stop.is_set():
+            return None
+        for _ in range(len(self.replicas)):
+            replica = next(self._order)
+            if replica.healthy:
+                return replica
+        return None
+
+    def mark_unhealthy(self, replica: Replica, error: Exception):
+        """Stop routing reads to a replica that failed until the checker sees it healthy again."""
+        print(f"Replica {replica} failed, reading from primary: {error}")
+        replica.healthy = False
+        replica.discard()
+
+    def close(self):
+        self._stop.set()
+        if self._checker and self._checker.is_alive():
+            self._checker.join(timeout=1)
+        for replica in self.replicas:
+            replica.close()
+
+_pool: Optional[ReplicaPool] = None
+_pool_lock = threading.Lock()
+
+def get_replica_pool() -> ReplicaPool:
+    """Shared pool, so every connection reuses one checker thread and its results."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ReplicaPool.from_env()
+        return _pool
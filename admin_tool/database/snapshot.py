@@ -0,0 +1,224 @@
+import asyncio
+import json
+import sqlite3
+import time
+from dataclasses import asdict, dataclass, field, fields
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import bcrypt
+
+from ..models import User, Photo, Comment
+from ..services.cache_dir import user_cache_dir
+
+MODELS = {
+    'users': User,
+    'photos': Photo,
+    'comments': Comment,
+}
+
+# Counts change without new rows appearing, so incremental syncs refresh them separately
+COUNT_FIELDS = {
+    'users': ('photo_count', 'comment_count', 'like_count'),
+    'photos': ('like_count', 'comment_count'),
+}
+
+# Database methods used to sync each table: full listing, rows past the
+# watermark, live ids, rows by id and the grouped counts (all, or by id)
+FETCHERS = {
+    'users': ('get_all_users', 'get_users_since', 'get_user_ids', 'get_users_by_ids', 'get_user_counts'),
+    'photos': ('get_latest_photos', 'get_photos_since', 'get_photo_ids', 'get_photos_by_ids', 'get_photo_counts'),
+    'comments': ('get_all_comments', 'get_comments_since', 'get_comment_ids', 'get_comments_by_ids', None),
+}
+
+@dataclass
+class SyncPlan:
+    """What a sync needs to know about the local table, and what it fetched.
+
+    Plans are made and applied on the thread that owns the SQLite connection;
+    only the fetch in between talks to MySQL, so it can run anywhere.
+    """
+    table: str
+    watermark: Optional[Tuple[datetime, int]]
+    local_ids: Set[int]
+    rows: list = field(default_factory=list)
+    live_ids: Optional[Set[int]] = None
+    count_ids: Optional[List[int]] = None  # Rows whose counts are refreshed; None for all of them
+    counts: Optional[Dict[int, dict]] = None
+
+    @property
+    def full(self) -> bool:
+        return self.watermark is None
+
+    @property
+    def refresh_counts(self) -> bool:
+        return self.count_ids is None or bool(self.count_ids)
+
+    def missing_ids(self) -> List[int]:
+        """Older rows that became visible again (a soft delete that was undone)."""
+        return list(self.live_ids - self.local_ids - {row.id for row in self.rows})
+
+class SnapshotStore:
+    """Local SQLite copy of the last-seen listings.
+
+    Frames render from it on launch, then sync incrementally against MySQL:
+    rows past the (createdAt, id) watermark are fetched, deleted ids are
+    reconciled and counts refreshed with cheap grouped queries: for every row
+    once every `count_refresh_interval` seconds, and in between only for the
+    rows on screen. A full resync runs every `full_sync_interval` seconds to
+    pick up edits. When MySQL is unreachable the snapshot is used read-only.
+    """
+
+    def __init__(self, path: Optional[Path] = None, full_sync_interval: float = 24 * 3600,
+                 count_refresh_interval: float = 600):
+        self.path = path or user_cache_dir() / 'snapshot.sqlite3'
+        self.full_sync_interval = full_sync_interval
+        self.count_refresh_interval = count_refresh_interval
+        self.connection = sqlite3.connect(str(self.path))
+        for table in MODELS:
+            self.connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} (id INTEGER PRIMARY KEY, createdAt TEXT NOT NULL, data TEXT NOT NULL)"
+            )
+            self.connection.execute(f"CREATE INDEX IF NOT EXISTS {table}_created ON {table} (createdAt, id)")
+        self.connection.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        self.connection.commit()
+
+    def load(self, table: str) -> list:
+        """Every row of 'users', 'photos' or 'comments', newest first."""
+        return self._load(table)
+
+    def sync(self, table: str, db, visible_ids: Iterable[int] = ()) -> None:
+        """Sync one table inline against a Database."""
+        self.apply_sync(self.fetch_sync(self.plan_sync(table, visible_ids), db))
+
+    def plan_sync(self, table: str, visible_ids: Iterable[int] = ()) -> SyncPlan:
+        """Read the local watermark; a plan without one asks for a full resync.
+
+        Unless all counts are due, only those of `visible_ids` are refreshed.
+        """
+        last_full_sync = float(self._get_meta(f"{table}:full_sync") or 0)
+        row = self.connection.execute(
+            f"SELECT createdAt, id FROM {table} ORDER BY createdAt DESC, id DESC LIMIT 1"
+        ).fetchone()
+        if row is None or time.time() - last_full_sync > self.full_sync_interval:
+            return SyncPlan(table, None, set())
+        local_ids = {row_id for (row_id,) in self.connection.execute(f"SELECT id FROM {table}").fetchall()}
+        last_counts = float(self._get_meta(f"{table}:counts") or 0)
+        count_ids = None if time.time() - last_counts > self.count_refresh_interval else list(visible_ids)
+        return SyncPlan(table, (datetime.fromisoformat(row[0]), row[1]), local_ids, count_ids=count_ids)
+
+    @staticmethod
+    def fetch_sync(plan: SyncPlan, db) -> SyncPlan:
+        fetch_all, fetch_since, fetch_ids, fetch_by_ids, fetch_counts = (
+            getattr(db, name) if name else None for name in FETCHERS[plan.table]
+        )
+        if plan.full:
+            plan.rows = fetch_all()
+            return plan
+        plan.rows = fetch_since(*plan.watermark)
+        plan.live_ids = set(fetch_ids())
+        plan.rows += fetch_by_ids(plan.missing_ids())
+        if fetch_counts and plan.refresh_counts:
+            plan.counts = fetch_counts(plan.count_ids)
+        return plan
+
+    @staticmethod
+    async def async_fetch_sync(plan: SyncPlan, adb) -> SyncPlan:
+        """Same as fetch_sync against an AsyncDatabase, with the queries of one table run concurrently."""
+        fetch_all, fetch_since, fetch_ids, fetch_by_ids, fetch_counts = (
+            getattr(adb, name) if name else None for name in FETCHERS[plan.table]
+        )
+        if plan.full:
+            plan.rows = await fetch_all()
+            return plan
+        queries = [fetch_since(*plan.watermark), fetch_ids()]
+        if fetch_counts and plan.refresh_counts:
+            queries.append(fetch_counts(plan.count_ids))
+        results = await asyncio.gather(*queries)
+        plan.rows, plan.live_ids = results[0], set(results[1])
+        plan.counts = results[2] if len(results) > 2 else None
+        plan.rows += await fetch_by_ids(plan.missing_ids())
+        return plan
+
+    def apply_sync(self, plan: SyncPlan):
+        table = plan.table
+        if plan.full:
+            self.connection.execute(f"DELETE FROM {table}")
+            self._save(table, plan.rows)
+            # The listing query brought every count along
+            self._set_meta(f"{table}:full_sync", str(time.time()))
+            self._set_meta(f"{table}:counts", str(time.time()))
+            return
+
+        self._save(table, plan.rows)
+        # Reconcile rows deleted since the plan was made
+        self.connection.executemany(
+            f"DELETE FROM {table} WHERE id = ?", ((i,) for i in plan.local_ids - plan.live_ids)
+        )
+        self.connection.commit()
+        if plan.counts is not None:
+            self._update_counts(table, plan.counts, plan.count_ids)
+
+    def remember_admin(self, email: str, password: str):
+        """Keep a local hash of the admin's password so the snapshot can be opened offline."""
+        hashed = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+        self._set_meta(f"admin:{email.lower()}", hashed)
+
+    def verify_offline_login(self, email: str, password: str) -> bool:
+        hashed = self._get_meta(f"admin:{email.lower()}")
+        return bool(hashed) and bcrypt.checkpw(password.encode('utf-8'), hashed.encode('utf-8'))
+
+    def _update_counts(self, table: str, counts: Dict[int, dict], ids: Optional[List[int]] = None):
+        fields = COUNT_FIELDS[table]
+        paths = ", ".join(f"'$.{field}', ?" for field in fields)
+        if ids is None:
+            ids = [row_id for (row_id,) in self.connection.execute(f"SELECT id FROM {table}").fetchall()]
+            self._set_meta(f"{table}:counts", str(time.time()))
+        self.connection.executemany(
+            f"UPDATE {table} SET data = json_set(data, {paths}) WHERE id = ?",
+            (tuple(counts.get(row_id, {}).get(field, 0) for field in fields) + (row_id,) for row_id in ids)
+        )
+        self.connection.commit()
+
+    def load_page(self, table: str, sort_key: str = 'created_at', descending: bool = True,
+                  limit: int = 500, offset: int = 0) -> list:
+        """One page of the table view, sorted by SQLite; only this page is read into memory."""
+        if sort_key not in {f.name for f in fields(MODELS[table])}:
+            raise ValueError(f"Cannot sort by {sort_key}")
+        direction = "DESC" if descending else "ASC"
+        return self._load(
+            table,
+            f"ORDER BY json_extract(data, '$.{sort_key}') {direction}, id {direction} LIMIT ? OFFSET ?",
+            (limit, offset)
+        )
+
+    def _load(self, table: str, order_by: str = "ORDER BY createdAt DESC, id DESC", params: tuple = ()) -> list:
+        model = MODELS[table]
+        rows = self.connection.execute(f"SELECT data FROM {table} {order_by}", params).fetchall()
+        items = []
+        for (data,) in rows:
+            fields = json.loads(data)
+            if fields.get('created_at'):
+                fields['created_at'] = datetime.fromisoformat(fields['created_at'])
+            items.append(model(**fields))
+        return items
+
+    def _save(self, table: str, items: list):
+        self.connection.executemany(
+            f"INSERT OR REPLACE INTO {table} (id, createdAt, data) VALUES (?, ?, ?)",
+            ((item.id, item.created_at.isoformat(), json.dumps(asdict(item), default=datetime.isoformat))
+             for item in items)
+        )
+        self.connection.commit()
+
+    def _get_meta(self, key: str) -> Optional[str]:
+        row = self.connection.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value: str):
+        self.connection.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+        self.connection.commit()
+
+    def close(self):
+        self.connection.close()
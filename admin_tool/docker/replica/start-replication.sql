@@ -0,0 +1,8 @@
+-- The database and everything in it arrive from the primary through GTID auto-positioning
+CHANGE REPLICATION SOURCE TO
+    SOURCE_HOST = 'primary',
+    SOURCE_USER = 'root',
+    SOURCE_PASSWORD = 'admin',
+    SOURCE_AUTO_POSITION = 1,
+    GET_SOURCE_PUBLIC_KEY = 1;
+START REPLICA;
@@ -1,3 +1,5 @@
+import asyncio
+import os
 import customtkinter as ctk
 from dotenv import load_dotenv
 
@@ -5,8 +7,12 @@ from .components import (
     UserManagementFrame,
     PhotoManagementFrame,
     CommentManagementFrame,
+    DuplicatePhotosFrame,
+    SpamCommentsFrame,
     LoginFrame
 )
+from .database import PurgeWorker, SnapshotStore, AsyncDatabase, get_replica_pool
+from .services import MemoryMonitor, AsyncTkBridge, InvalidationBus
 
 # Load environment variables
 load_dotenv()
@@ -23,14 +29,29 @@ class AdminApp(ctk.CTk):
         self.grid_rowconfigure(0, weight=1)
         self.grid_columnconfigure(0, weight=1)
 
+        # Local copy of the listings, so frames can render before MySQL answers
+        self.snapshot = SnapshotStore(count_refresh_interval=float(os.getenv('ADMIN_COUNT_REFRESH_INTERVAL', 600)))
+
+        # Asyncio loop for the listing queries, driven next to Tk's mainloop
+        self.async_bridge = AsyncTkBridge(self)
+        # Health-checked replicas for those queries, probed in the background
+        # and shared with every Database connection of the process
+        self.replicas = get_replica_pool()
+
+        # Writes from any tab are published here so every affected tab refreshes
+        self.invalidation_bus = InvalidationBus(self, debounce=int(os.getenv('ADMIN_REFRESH_DEBOUNCE_MS', 300)))
+        self.pending_syncs = set()
+
         # Create login frame
-        self.login_frame = LoginFrame(self, self.on_successful_login)
+        self.login_frame = LoginFrame(self, self.on_successful_login, self.snapshot)
         self.login_frame.grid(row=0, column=0, sticky="nsew")
 
         # Initialize admin interface (hidden initially)
         self.initialize_admin_interface()
         self.hide_admin_interface()
 
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
+
     def initialize_admin_interface(self):
         # Configure grid layout for admin interface
         self.grid_columnconfigure(1, weight=1)
@@ -38,7 +59,7 @@ class AdminApp(ctk.CTk):
         # Create navigation frame
         self.navigation_frame = ctk.CTkFrame(self, corner_radius=0)
         self.navigation_frame.grid(row=0, column=0, sticky="nsew")
-        self.navigation_frame.grid_rowconfigure(4, weight=1)
+        self.navigation_frame.grid_rowconfigure(6, weight=1)
 
         self.navigation_frame_label = ctk.CTkLabel(
             self.navigation_frame, text="DevAtHome Admin",
@@ -77,12 +98,39 @@ class AdminApp(ctk.CTk):
         )
         self.comment_button.grid(row=3, column=0, sticky="ew")
 
+        self.duplicate_button = ctk.CTkButton(
+            self.navigation_frame, corner_radius=0, height=40,
+            border_spacing=10, text="Duplicate Photos",
+            fg_color="transparent", text_color=("gray10", "gray90"),
+            hover_color=("gray70", "gray30"),
+            anchor="w",
+            command=self.duplicate_button_event
+        )
+        self.duplicate_button.grid(row=4, column=0, sticky="ew")
+
+        self.spam_button = ctk.CTkButton(
+            self.navigation_frame, corner_radius=0, height=40,
+            border_spacing=10, text="Spam Comments",
+            fg_color="transparent", text_color=("gray10", "gray90"),
+            hover_color=("gray70", "gray30"),
+            anchor="w",
+            command=self.spam_button_event
+        )
+        self.spam_button.grid(row=5, column=0, sticky="ew")
+
         # Create appearance mode menu
         self.appearance_mode_menu = ctk.CTkOptionMenu(
             self.navigation_frame, values=["Light", "Dark", "System"],
             command=self.change_appearance_mode_event
         )
-        self.appearance_mode_menu.grid(row=5, column=0, padx=20, pady=20, sticky="s")
+        self.appearance_mode_menu.grid(row=7, column=0, padx=20, pady=20, sticky="s")
+
+        # Background purge progress
+        self.purge_status_label = ctk.CTkLabel(
+            self.navigation_frame, text="",
+            font=ctk.CTkFont(size=11)
+        )
+        self.purge_status_label.grid(row=8, column=0, padx=20, pady=(0, 20))
 
         # Create main frame
         self.main_frame = ctk.CTkFrame(self, corner_radius=0)
@@ -91,9 +139,16 @@ class AdminApp(ctk.CTk):
         self.main_frame.grid_columnconfigure(0, weight=1)
 
         # Create frames for different sections
-        self.user_frame = UserManagementFrame(self.main_frame)
-        self.photo_frame = PhotoManagementFrame(self.main_frame)
-        self.comment_frame = CommentManagementFrame(self.main_frame)
+        self.user_frame = UserManagementFrame(self.main_frame, self.snapshot, self.invalidation_bus, self.request_sync)
+        self.photo_frame = PhotoManagementFrame(self.main_frame, self.snapshot, self.invalidation_bus, self.request_sync)
+        self.comment_frame = CommentManagementFrame(self.main_frame, self.snapshot, self.invalidation_bus, self.request_sync)
+        self.duplicate_frame = DuplicatePhotosFrame(self.main_frame, self.invalidation_bus)
+        self.spam_frame = SpamCommentsFrame(self.main_frame, self.invalidation_bus)
+        self.listing_tabs = {
+            'users': self.user_frame,
+            'photos': self.photo_frame,
+            'comments': self.comment_frame,
+        }
 
         # Set default frame
         self.select_frame_by_name("user")
@@ -112,32 +167,166 @@ class AdminApp(ctk.CTk):
 
     def on_successful_login(self):
         self.show_admin_interface()
+        # The visible tab shows the last snapshot while the others wait for the sync
+        self.after_idle(self.user_frame.show_snapshot)
+        self.load_all_tabs()
+        self.start_purge_worker()
+        self.start_memory_monitor()
+
+    def load_all_tabs(self):
+        """Sync every listing tab at once; each renders as soon as its own data is in."""
+        self.load_tabs(list(self.listing_tabs))
+
+    def request_sync(self, table):
+        """Sync one tab on the asyncio thread; requests from one Tk pass share a connection."""
+        if not self.pending_syncs:
+            self.after_idle(self.flush_syncs)
+        self.pending_syncs.add(table)
+
+    def flush_syncs(self):
+        tables, self.pending_syncs = list(self.pending_syncs), set()
+        self.load_tabs(tables)
+
+    def load_tabs(self, tables):
+        plans = [self.snapshot.plan_sync(table, self.listing_tabs[table].visible_ids()) for table in tables]
+        # A replica may not have the rows a tab just wrote yet
+        use_primary = self.invalidation_bus.published_within(float(os.getenv('DB_READ_YOUR_WRITES_WINDOW', 5)))
+        self.async_bridge.submit(
+            self.fetch_all_tabs(plans, use_primary),
+            errback=lambda error: self.on_tabs_offline(error, tables)
+        )
+
+    async def fetch_all_tabs(self, plans, use_primary=False):
+        # Runs on the asyncio thread: queries only, SQLite and widgets stay on the Tk thread
+        adb = await AsyncDatabase.connect(self.replicas, use_primary)
+        try:
+            await asyncio.gather(*(self.fetch_tab(adb, plan) for plan in plans))
+        finally:
+            await adb.close()
+
+    async def fetch_tab(self, adb, plan):
+        await SnapshotStore.async_fetch_sync(plan, adb)
+        self.async_bridge.post(self.apply_tab, plan)
+
+    def apply_tab(self, plan):
+        frame = self.listing_tabs[plan.table]
+        self.snapshot.apply_sync(plan)
+        frame.set_online()
+        # Cards show placeholders and the image loader fetches every tab's images in parallel
+        frame.show_snapshot()
+
+    def on_tabs_offline(self, error, tables):
+        print(f"Error loading listings: {error}")
+        for table in tables:
+            frame = self.listing_tabs[table]
+            frame.set_offline()
+            frame.show_snapshot()
+
+    def start_memory_monitor(self):
+        if hasattr(self, 'memory_monitor'):
+            return
+        # The RSS budget check is cheap; the object walk and tracemalloc are for debugging
+        self.memory_monitor = MemoryMonitor(
+            budget_mb=float(os.getenv('ADMIN_MEMORY_BUDGET_MB', 1024)),
+            detailed=os.getenv('ADMIN_MEMORY_DEBUG') == '1',
+            trace=os.getenv('ADMIN_MEMORY_TRACE') == '1'
+        )
+        self.memory_check_interval = int(float(os.getenv('ADMIN_MEMORY_CHECK_INTERVAL', 600)) * 1000)
+        self.after(self.memory_check_interval, self.check_memory)
+
+    def check_memory(self):
+        self.memory_monitor.check({
+            'users': self.user_frame,
+            'photos': self.photo_frame,
+            'comments': self.comment_frame,
+        })
+        self.after(self.memory_check_interval, self.check_memory)
+
+    def start_purge_worker(self):
+        if hasattr(self, 'purge_worker'):
+            return
+        self.purge_worker = PurgeWorker()
+        self.purge_worker.start()
+        # Deletes without an undo are purged right away rather than at the next poll
+        self.invalidation_bus.subscribe(('user', 'photo'), self.purge_worker.wake)
+        self.update_purge_status()
+
+    def update_purge_status(self):
+        # Polled from the Tk thread; the worker never touches widgets itself
+        deletion = self.purge_worker.current
+        if deletion:
+            self.purge_status_label.configure(
+                text=f"Purging {deletion.entity_type} #{deletion.entity_id}\n{deletion.purged_rows} rows removed"
+            )
+        else:
+            self.purge_status_label.configure(text="")
+        self.after(1000, self.update_purge_status)
+
+    def on_close(self):
+        # Nothing can be undone once the window is gone
+        self.user_frame.release_undo()
+        self.photo_frame.release_undo()
+        self.async_bridge.close()
+        self.replicas.close()
+        if hasattr(self, 'purge_worker') and self.purge_worker.is_alive():
+            # Finish the purge first: a deleted user or photo stays on the site until then
+            self.withdraw()
+            print("Purging deleted users and photos before exiting...")
+            self.purge_worker.finish()
+            self.wait_for_purge()
+        else:
+            self.destroy()
+
+    def wait_for_purge(self):
+        if self.purge_worker.is_alive():
+            self.after(200, self.wait_for_purge)
+        else:
+            self.destroy()
 
     def select_frame_by_name(self, name):
         # Hide all frames
         self.user_frame.grid_remove()
         self.photo_frame.grid_remove()
         self.comment_frame.grid_remove()
+        self.duplicate_frame.grid_remove()
+        self.spam_frame.grid_remove()
 
         # Show selected frame
         if name == "user":
             self.user_frame.grid(row=0, column=0, sticky="nsew")
+            self.user_frame.on_show()
             self.user_button.configure(fg_color=("gray75", "gray25"))
         else:
             self.user_button.configure(fg_color="transparent")
         
         if name == "photo":
             self.photo_frame.grid(row=0, column=0, sticky="nsew")
+            self.photo_frame.on_show()
             self.photo_button.configure(fg_color=("gray75", "gray25"))
         else:
             self.photo_button.configure(fg_color="transparent")
 
         if name == "comment":
             self.comment_frame.grid(row=0, column=0, sticky="nsew")
+            self.comment_frame.on_show()
             self.comment_button.configure(fg_color=("gray75", "gray25"))
         else:
             self.comment_button.configure(fg_color="transparent")
 
+        if name == "duplicate":
+            self.duplicate_frame.grid(row=0, column=0, sticky="nsew")
+            self.duplicate_frame.on_show()
+            self.duplicate_button.configure(fg_color=("gray75", "gray25"))
+        else:
+            self.duplicate_button.configure(fg_color="transparent")
+
+        if name == "spam":
+            self.spam_frame.grid(row=0, column=0, sticky="nsew")
+            self.spam_frame.on_show()
+            self.spam_button.configure(fg_color=("gray75", "gray25"))
+        else:
+            self.spam_button.configure(fg_color="transparent")
+
     def user_button_event(self):
         self.select_frame_by_name("user")
 
@@ -147,6 +336,12 @@ class AdminApp(ctk.CTk):
     def comment_button_event(self):
         self.select_frame_by_name("comment")
 
+    def duplicate_button_event(self):
+        self.select_frame_by_name("duplicate")
+
+    def spam_button_event(self):
+        self.select_frame_by_name("spam")
+
     def change_appearance_mode_event(self, new_appearance_mode):
         ctk.set_appearance_mode(new_appearance_mode)
 
@@ -1,5 +1,6 @@
 from .user import User
 from .comment import Comment
 from .photo import Photo
+from .deletion import PendingDeletion
 
-__all__ = ['User', 'Comment', 'Photo']
+__all__ = ['User', 'Comment', 'Photo', 'PendingDeletion']
@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+@dataclass
+class PendingDeletion:
+    id: int
+    entity_type: str  # 'user' or 'photo'
+    entity_id: int
+    status: str  # 'pending' (can still be undone), 'released' (purged next) or 'purging'
+    requested_at: datetime
+    purged_rows: int = 0
+    updated_at: Optional[datetime] = None
@@ -0,0 +1,9 @@
+from .image_client import ImageClient, get_image_client
+from .image_loader import ImageLoader, get_image_loader
+from .duplicate_detection import PhotoHashIndex, DuplicateScanner
+from .spam_clustering import SpamAnalyzer
+from .memory import MemoryMonitor
+from .async_tk import AsyncTkBridge
+from .invalidation import InvalidationBus
+
+__all__ = ['ImageClient', 'get_image_client', 'ImageLoader', 'get_image_loader', 'PhotoHashIndex', 'DuplicateScanner', 'SpamAnalyzer', 'MemoryMonitor', 'AsyncTkBridge', 'InvalidationBus']
@@ -0,0 +1,64 @@
+import asyncio
+import queue
+import threading
+from typing import Callable, Optional
+
+class AsyncTkBridge:
+    """Runs an asyncio loop in a background thread alongside Tk's mainloop.
+
+    Coroutines are submitted from the Tk thread. Their results are queued
+    and handed to callbacks from an `after` poll, so callbacks always run
+    on the Tk thread and the loop thread never touches a widget.
+    """
+
+    def __init__(self, root, poll_interval: int = 20):
+        self.root = root
+        self.poll_interval = poll_interval
+        self.loop = asyncio.new_event_loop()
+        self.results: "queue.Queue" = queue.Queue()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+        self._poll_id = self.root.after(self.poll_interval, self._poll)
+
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def submit(self, coro, callback: Optional[Callable] = None, errback: Optional[Callable] = None):
+        """Schedule `coro` on the loop; `callback(result)` or `errback(error)` runs on the Tk thread."""
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+        def done(future):
+            try:
+                result = future.result()
+            except (Exception, asyncio.CancelledError) as e:
+                if errback:
+                    self.post(errback, e)
+                else:
+                    print(f"Background task failed: {e}")
+                return
+            if callback:
+                self.post(callback, result)
+
+        future.add_done_callback(done)
+        return future
+
+    def post(self, callback: Callable, *args):
+        """Run `callback(*args)` on the Tk thread; safe to call from the loop thread."""
+        self.results.put((callback, args))
+
+    def _poll(self):
+        while True:
+            try:
+                callback, args = self.results.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                callback(*args)
+            except Exception as e:
+                print(f"Error handling background result: {e}")
+        self._poll_id = self.root.after(self.poll_interval, self._poll)
+
+    def close(self):
+        self.root.after_cancel(self._poll_id)
+        self.loop.call_soon_threadsafe(self.loop.stop)
@@ -0,0 +1,17 @@
+import os
+import sys
+from pathlib import Path
+
+APP_NAME = 'devathome_admin'
+
+def user_cache_dir() -> Path:
+    """Per-user cache directory for data the admin tool can rebuild."""
+    if sys.platform == 'darwin':
+        base = Path.home() / 'Library' / 'Caches'
+    elif sys.platform == 'win32':
+        base = Path(os.getenv('LOCALAPPDATA', Path.home() / 'AppData' / 'Local'))
+    else:
+        base = Path(os.getenv('XDG_CACHE_HOME', Path.home() / '.cache'))
+    path = base / APP_NAME
+    path.mkdir(parents=True, exist_ok=True)
+    return path
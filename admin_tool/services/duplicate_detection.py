@@ -0,0 +1,215 @@
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+from PIL import Image
+
+from ..database import Database
+from .cache_dir import user_cache_dir
+from .image_client import get_image_client
+
+HASH_KINDS = ('ahash', 'dhash', 'phash')
+
+# Number of set bits for every byte value, used to popcount XORed hashes
+POPCOUNT = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+def _pack_bits(bits: np.ndarray) -> int:
+    return int.from_bytes(np.packbits(bits.flatten()).tobytes(), 'big')
+
+def _grayscale(img: Image.Image, size) -> np.ndarray:
+    return np.asarray(img.convert('L').resize(size, Image.LANCZOS), dtype=np.float64)
+
+def average_hash(img: Image.Image) -> int:
+    pixels = _grayscale(img, (8, 8))
+    return _pack_bits(pixels > pixels.mean())
+
+def difference_hash(img: Image.Image) -> int:
+    pixels = _grayscale(img, (9, 8))
+    return _pack_bits(pixels[:, 1:] > pixels[:, :-1])
+
+def _dct_matrix(n: int) -> np.ndarray:
+    k = np.arange(n)[:, None]
+    i = np.arange(n)[None, :]
+    return np.cos(np.pi * (2 * i + 1) * k / (2 * n))
+
+DCT_32 = _dct_matrix(32)
+
+def perceptual_hash(img: Image.Image) -> int:
+    pixels = _grayscale(img, (32, 32))
+    low = (DCT_32 @ pixels @ DCT_32.T)[:8, :8]
+    # The DC term only reflects overall brightness, keep it out of the median
+    return _pack_bits(low > np.median(low.flatten()[1:]))
+
+def image_hashes(img: Image.Image) -> Dict[str, int]:
+    return {
+        'ahash': average_hash(img),
+        'dhash': difference_hash(img),
+        'phash': perceptual_hash(img),
+    }
+
+def hamming_distances(query: np.ndarray, hashes: np.ndarray) -> np.ndarray:
+    """Hamming distances between each query hash and every hash, shape (len(query), len(hashes))."""
+    xor = np.ascontiguousarray(np.bitwise_xor(query[:, None], hashes[None, :]))
+    return POPCOUNT[xor.view(np.uint8)].reshape(xor.shape + (8,)).sum(axis=-1, dtype=np.uint8)
+
+class PhotoHashIndex:
+    """Compact, disk-backed table of photo hashes: one uint64 column per hash kind."""
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = path or user_cache_dir() / 'photo_hashes.npz'
+        self.photo_ids = np.empty(0, dtype=np.int64)
+        self.hashes = {kind: np.empty(0, dtype=np.uint64) for kind in HASH_KINDS}
+        # Highest photo id already looked at; photos whose image failed to load
+        # (CDN outage, open circuit breaker) are kept aside and retried next scan
+        self.last_scanned_id = 0
+        self.failed_ids = np.empty(0, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self.photo_ids)
+
+    def load(self) -> 'PhotoHashIndex':
+        if self.path.exists():
+            with np.load(self.path) as data:
+                self.photo_ids = data['photo_ids']
+                self.hashes = {kind: data[kind] for kind in HASH_KINDS}
+                self.last_scanned_id = int(data['last_scanned_id'])
+                if 'failed_ids' in data.files:
+                    self.failed_ids = data['failed_ids']
+        return self
+
+    def save(self):
+        tmp_path = self.path.with_suffix('.tmp.npz')
+        np.savez(tmp_path, photo_ids=self.photo_ids, failed_ids=self.failed_ids,
+                 last_scanned_id=np.int64(self.last_scanned_id), **self.hashes)
+        tmp_path.replace(self.path)
+
+    def add(self, photo_ids: List[int], hashes: List[Dict[str, int]]):
+        if not photo_ids:
+            return
+        self.photo_ids = np.concatenate([self.photo_ids, np.array(photo_ids, dtype=np.int64)])
+        for kind in HASH_KINDS:
+            new = np.array([h[kind] for h in hashes], dtype=np.uint64)
+            self.hashes[kind] = np.concatenate([self.hashes[kind], new])
+
+    def retain(self, live_ids) -> int:
+        """Drop photos whose rows no longer exist. Returns the number removed.
+
+        Pass every stored id, soft-deleted ones included: a hash dropped during
+        the undo window would never be computed again after an undo.
+        """
+        live_ids = np.fromiter(live_ids, dtype=np.int64)
+        self.failed_ids = self.failed_ids[np.isin(self.failed_ids, live_ids)]
+        keep = np.isin(self.photo_ids, live_ids)
+        removed = int((~keep).sum())
+        self.photo_ids = self.photo_ids[keep]
+        self.hashes = {kind: values[keep] for kind, values in self.hashes.items()}
+        return removed
+
+    def within(self, photo_id: int, candidate_ids: List[int], threshold: int = 6) -> List[int]:
+        """The candidates whose pHash and dHash are both within `threshold` bits of `photo_id`'s."""
+        position = np.flatnonzero(self.photo_ids == photo_id)
+        candidates = np.array(candidate_ids, dtype=np.int64)
+        rows = np.flatnonzero(np.isin(self.photo_ids, candidates))
+        if not len(position) or not len(rows):
+            return []
+        close = np.ones(len(rows), dtype=bool)
+        for kind in ('phash', 'dhash'):
+            close &= hamming_distances(self.hashes[kind][position], self.hashes[kind][rows])[0] <= threshold
+        near = set(self.photo_ids[rows[close]].tolist())
+        return [photo_id for photo_id in candidate_ids if photo_id in near]
+
+    def find_clusters(self, threshold: int = 6, block_size: int = 4_000_000) -> List[List[int]]:
+        """Group photos whose pHash and dHash are both within `threshold` bits.
+
+        Matches are chained, so two members of a cluster can be further apart;
+        use within() before treating a whole cluster as copies of one photo.
+        Distances are computed a block of rows at a time so the temporary
+        matrix stays around `block_size` cells whatever the index size.
+        """
+        n = len(self.photo_ids)
+        if n < 2:
+            return []
+
+        phash = self.hashes['phash']
+        dhash = self.hashes['dhash']
+        rows_per_block = max(1, block_size // n)
+        parent = list(range(n))
+
+        def find(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        for start in range(0, n, rows_per_block):
+            stop = min(n, start + rows_per_block)
+            close = (hamming_distances(phash[start:stop], phash) <= threshold) & \
+                    (hamming_distances(dhash[start:stop], dhash) <= threshold)
+            rows, cols = np.nonzero(close)
+            rows += start
+            upper = rows < cols
+            for i, j in zip(rows[upper], cols[upper]):
+                root_i, root_j = find(i), find(j)
+                if root_i != root_j:
+                    parent[root_j] = root_i
+
+        clusters: Dict[int, List[int]] = {}
+        for i in range(n):
+            clusters.setdefault(find(i), []).append(int(self.photo_ids[i]))
+        return sorted(
+            (sorted(members) for members in clusters.values() if len(members) > 1),
+            key=len, reverse=True
+        )
+
+class DuplicateScanner(threading.Thread):
+    """Background job that hashes photos added since the last scan and clusters duplicates."""
+
+    def __init__(self, threshold: int = 6, batch_size: int = 200):
+        super().__init__(daemon=True)
+        self.threshold = threshold
+        self.batch_size = batch_size
+        self.index = PhotoHashIndex()
+        self.hashed = 0
+        self.clusters: Optional[List[List[int]]] = None
+        self.error: Optional[Exception] = None
+
+    def run(self):
+        try:
+            db = Database()
+            self.index.load()
+            self.index.retain(db.get_stored_photo_ids())
+            client = get_image_client()
+
+            retry_ids = self.index.failed_ids.tolist()
+            self.index.failed_ids = np.empty(0, dtype=np.int64)
+            for start in range(0, len(retry_ids), self.batch_size):
+                self.hash_batch(client, db.get_photo_urls(retry_ids[start:start + self.batch_size]))
+                self.index.save()
+
+            while True:
+                batch = db.get_photo_urls_after(self.index.last_scanned_id, self.batch_size)
+                if not batch:
+                    break
+                self.hash_batch(client, batch)
+                self.index.last_scanned_id = batch[-1][0]
+                self.index.save()
+                if len(batch) < self.batch_size:
+                    break
+
+            self.clusters = self.index.find_clusters(self.threshold)
+        except Exception as e:
+            self.error = e
+
+    def hash_batch(self, client, batch):
+        ids, hashes, failed = [], [], []
+        for photo_id, url in batch:
+            img = client.fetch_image(url)
+            if img is None:
+                failed.append(photo_id)
+                continue
+            ids.append(photo_id)
+            hashes.append(image_hashes(img))
+        self.index.add(ids, hashes)
+        self.index.failed_ids = np.concatenate([self.index.failed_ids, np.array(failed, dtype=np.int64)])
+        self.hashed += len(ids)
@@ -0,0 +1,116 @@
+"""Local image server for exercising ImageClient offline.
+
+Every path returns a generated PNG with ETag and Last-Modified headers. Query
+parameters simulate a misbehaving CDN:
+
+    ?delay=2      sleep before answering
+    ?status=503   answer with that status instead of an image
+
+Setting ``server.down = True`` makes the server drop connections, like a dead
+host, and ``server.fail_next = n`` answers the next n requests with a 503.
+Statuses sent are recorded in ``server.statuses``.
+
+    python -m admin_tool.services.fake_image_server --port 8765
+"""
+import argparse
+import hashlib
+import threading
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO
+from urllib.parse import parse_qs, urlsplit
+
+from PIL import Image
+
+# Fixed so revalidation against a restarted server still matches
+LAST_MODIFIED = formatdate(0, usegmt=True)
+
+def render_image(path: str, size: int = 256) -> bytes:
+    digest = hashlib.md5(path.encode('utf-8')).digest()
+    img = Image.new('RGB', (size, size), tuple(digest[:3]))
+    buffer = BytesIO()
+    img.save(buffer, format='PNG')
+    return buffer.getvalue()
+
+class FakeImageHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.request_count += 1
+            failing = server.fail_next > 0
+            server.fail_next -= failing
+        if server.down:
+            self.close_connection = True
+            return
+
+        parts = urlsplit(self.path)
+        params = parse_qs(parts.query)
+        delay = float(params.get('delay', [0])[0])
+        if delay:
+            time.sleep(delay)
+
+        status = 503 if failing else int(params.get('status', [200])[0])
+        if status != 200:
+            self.send_response(status)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        body = render_image(parts.path)
+        etag = '"' + hashlib.md5(body).hexdigest() + '"'
+        if self.headers.get('If-None-Match') == etag or self.headers.get('If-Modified-Since') == LAST_MODIFIED:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'image/png')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('ETag', etag)
+        self.send_header('Last-Modified', LAST_MODIFIED)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_response(self, code, message=None):
+        self.server.statuses.append(code)
+        super().send_response(code, message)
+
+    def log_message(self, format, *args):
+        pass
+
+class FakeImageServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0):
+        super().__init__((host, port), FakeImageHandler)
+        self.down = False
+        self.fail_next = 0
+        self.request_count = 0
+        self.statuses = []
+        self.lock = threading.Lock()
+        self._thread = None
+
+    def url(self, path: str = '/image.png') -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}{path}"
+
+    def start(self) -> 'FakeImageServer':
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve generated images for offline testing")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    args = parser.parse_args()
+
+    server = FakeImageServer(args.host, args.port)
+    print(f"Serving fake images on {server.url('/')}")
+    server.serve_forever()
@@ -0,0 +1,205 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from io import BytesIO
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from PIL import Image
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+@dataclass
+class CachedImage:
+    content: bytes
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fetched_at: float
+
+class CircuitBreaker:
+    """Stops requests to a host after repeated failures, then lets one probe through after a cooldown."""
+
+    def __init__(self, failure_threshold: int, cooldown: float):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        return self.opened_at is not None
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self.opened_at is None:
+                return True
+            if time.monotonic() - self.opened_at < self.cooldown or self._probing:
+                return False
+            # Half-open: a single request decides whether the host is back
+            self._probing = True
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._probing = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            self._probing = False
+            if self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+
+class ImageClient:
+    """HTTP client for card images.
+
+    Limits concurrent requests per host, applies connect/read timeouts, retries
+    transient failures with exponential backoff, revalidates cached images with
+    ETag/If-Modified-Since and short-circuits hosts that keep failing so cards
+    fall back to their placeholder immediately.
+    """
+
+    def __init__(self, connect_timeout: float = 3.05, read_timeout: float = 10,
+                 max_per_host: int = 4, retries: int = 2, backoff: float = 0.5,
+                 failure_threshold: int = 3, cooldown: float = 30,
+                 max_age: float = 300, cache_size: int = 256):
+        self.timeout = (connect_timeout, read_timeout)
+        self.max_per_host = max_per_host
+        self.retries = retries
+        self.backoff = backoff
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.max_age = max_age
+        self.cache_size = cache_size
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=max_per_host)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        self._cache: "OrderedDict[str, CachedImage]" = OrderedDict()
+        self._host_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def fetch_image(self, url: Optional[str]) -> Optional[Image.Image]:
+        """Return the decoded image, or None if the caller should show a placeholder."""
+        content = self.fetch(url)
+        if content is None:
+            return None
+        try:
+            img = Image.open(BytesIO(content))
+            img.load()
+            return img
+        except Exception:
+            return None
+
+    def fetch(self, url: Optional[str]) -> Optional[bytes]:
+        if not url:
+            return None
+        host = urlsplit(url).netloc
+        cached = self._get_cached(url)
+        if cached and time.monotonic() - cached.fetched_at < self.max_age:
+            return cached.content
+
+        breaker = self._breaker(host)
+        if not breaker.allow():
+            # Serve a stale copy if we have one rather than nothing at all
+            return cached.content if cached else None
+
+        headers = {}
+        if cached:
+            if cached.etag:
+                headers['If-None-Match'] = cached.etag
+            if cached.last_modified:
+                headers['If-Modified-Since'] = cached.last_modified
+
+        with self._host_slot(host):
+            response = self._get_with_retry(url, headers)
+
+        if response is None or response.status_code in RETRY_STATUSES:
+            breaker.record_failure()
+            return cached.content if cached else None
+        breaker.record_success()
+
+        if response.status_code == 304 and cached:
+            cached.fetched_at = time.monotonic()
+            return cached.content
+        if response.status_code != 200:
+            return None
+
+        self._store(url, CachedImage(
+            content=response.content,
+            etag=response.headers.get('ETag'),
+            last_modified=response.headers.get('Last-Modified'),
+            fetched_at=time.monotonic()
+        ))
+        return response.content
+
+    def is_host_available(self, url: str) -> bool:
+        return not self._breaker(urlsplit(url).netloc).is_open
+
+    def _get_with_retry(self, url: str, headers: dict) -> Optional[requests.Response]:
+        response = None
+        for attempt in range(self.retries + 1):
+            if attempt:
+                time.sleep(self.backoff * 2 ** (attempt - 1))
+            try:
+                response = self.session.get(url, headers=headers, timeout=self.timeout)
+            except requests.RequestException:
+                response = None
+                continue
+            if response.status_code not in RETRY_STATUSES:
+                return response
+        return response
+
+    def _get_cached(self, url: str) -> Optional[CachedImage]:
+        with self._lock:
+            cached = self._cache.get(url)
+            if cached:
+                self._cache.move_to_end(url)
+            return cached
+
+    def _store(self, url: str, entry: CachedImage):
+        with self._lock:
+            self._cache[url] = entry
+            self._cache.move_to_end(url)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def _host_slot(self, host: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            if host not in self._host_slots:
+                self._host_slots[host] = threading.BoundedSemaphore(self.max_per_host)
+            return self._host_slots[host]
+
+    def _breaker(self, host: str) -> CircuitBreaker:
+        with self._lock:
+            if host not in self._breakers:
+                self._breakers[host] = CircuitBreaker(self.failure_threshold, self.cooldown)
+            return self._breakers[host]
+
+_client: Optional[ImageClient] = None
+
+def get_image_client() -> ImageClient:
+    """Shared client so connection pools, cache and breakers are reused across cards."""
+    global _client
+    if _client is None:
+        _client = ImageClient(
+            connect_timeout=float(os.getenv('IMAGE_CONNECT_TIMEOUT', 3.05)),
+            read_timeout=float(os.getenv('IMAGE_READ_TIMEOUT', 10)),
+            max_per_host=int(os.getenv('IMAGE_MAX_PER_HOST', 4)),
+            retries=int(os.getenv('IMAGE_RETRIES', 2)),
+            failure_threshold=int(os.getenv('IMAGE_BREAKER_THRESHOLD', 3)),
+            cooldown=float(os.getenv('IMAGE_BREAKER_COOLDOWN', 30)),
+            cache_size=int(os.getenv('IMAGE_CACHE_SIZE', 768))
+        )
+    return _client
@@ -0,0 +1,76 @@
+import os
+import queue
+import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, Tuple
+
+from PIL import Image
+
+from .image_client import ImageClient, get_image_client
+
+class ImageLoader:
+    """Fetches and decodes card images on worker threads.
+
+    Cards show a placeholder and call load(); the callback runs later on the Tk
+    thread with the thumbnail, or None when the image is unavailable. Results
+    are handed over through a queue drained by an `after` poll that only runs
+    while loads are pending, so a slow image host never blocks the UI.
+    """
+
+    def __init__(self, client: ImageClient, workers: int = 8, poll_interval: int = 30):
+        self.client = client
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="image-loader")
+        self.poll_interval = poll_interval
+        self.results: "queue.Queue" = queue.Queue()
+        self.pending = 0
+        self._poll_widget = None
+
+    def load(self, widget, url: Optional[str], callback: Callable, size: Optional[Tuple[int, int]] = None):
+        """Call `callback(image_or_none)` on the Tk thread, unless `widget` is destroyed by then."""
+        future = self.executor.submit(self._fetch, url, size)
+        future.add_done_callback(lambda f: self.results.put((widget, callback, f)))
+        self.pending += 1
+        if self._poll_widget is None:
+            self._poll_widget = widget.winfo_toplevel()
+            self._poll_widget.after(self.poll_interval, self._poll)
+
+    def _fetch(self, url: Optional[str], size: Optional[Tuple[int, int]]) -> Optional[Image.Image]:
+        img = self.client.fetch_image(url)
+        if img is not None and size:
+            img.thumbnail(size)
+        return img
+
+    def _poll(self):
+        while True:
+            try:
+                widget, callback, future = self.results.get_nowait()
+            except queue.Empty:
+                break
+            self.pending -= 1
+            img = None if future.exception() else future.result()
+            try:
+                if widget.winfo_exists():
+                    callback(img)
+                    continue
+            except tk.TclError:
+                pass  # The whole window is gone
+            except Exception as e:
+                print(f"Error showing image: {e}")
+            if img is not None:
+                img.close()
+
+        try:
+            if self.pending:
+                self._poll_widget.after(self.poll_interval, self._poll)
+                return
+        except tk.TclError:
+            pass
+        self._poll_widget = None
+
+_loader: Optional[ImageLoader] = None
+
+def get_image_loader() -> ImageLoader:
+    global _loader
+    if _loader is None:
+        _loader = ImageLoader(get_image_client(), workers=int(os.getenv('IMAGE_LOADER_WORKERS', 8)))
+    return _loader
@@ -0,0 +1,49 @@
+import threading
+import time
+from typing import Callable, Dict, List, Set
+
+class InvalidationBus:
+    """Tells the tabs that data they show was changed by a write.
+
+    Database write paths publish the entity type they wrote ('user', 'photo'
+    or 'comment'). Events are collected and delivered on the Tk thread once
+    none arrived for `debounce` ms, and each subscriber is called once per
+    delivery however many events it matched, so a burst of deletes causes a
+    single refresh per tab. publish() is safe to call from any thread.
+    """
+
+    def __init__(self, root, debounce: int = 300, poll_interval: int = 100):
+        self.root = root
+        self.debounce = debounce / 1000
+        self.poll_interval = poll_interval
+        self.subscribers: Dict[str, List[Callable]] = {}
+        self.last_published = float('-inf')
+        self._pending: Set[str] = set()
+        self._lock = threading.Lock()
+        self.root.after(self.poll_interval, self._poll)
+
+    def subscribe(self, topics, callback: Callable):
+        for topic in topics:
+            self.subscribers.setdefault(topic, []).append(callback)
+
+    def publish(self, topic: str):
+        with self._lock:
+            self._pending.add(topic)
+            self.last_published = time.monotonic()
+
+    def published_within(self, seconds: float) -> bool:
+        return time.monotonic() - self.last_published < seconds
+
+    def _poll(self):
+        with self._lock:
+            topics = set()
+            if self._pending and time.monotonic() - self.last_published >= self.debounce:
+                topics, self._pending = self._pending, set()
+        # Bound methods compare equal, so a tab subscribed to several topics is refreshed once
+        callbacks = dict.fromkeys(callback for topic in topics for callback in self.subscribers.get(topic, []))
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                print(f"Error refreshing after a change: {e}")
+        self.root.after(self.poll_interval, self._poll)
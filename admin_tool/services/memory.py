@@ -0,0 +1,208 @@
+"""Memory instrumentation for the admin UI.
+
+MemoryMonitor checks process memory against a budget. In detailed mode it
+also samples tracemalloc totals, widget counts per frame and live CTkImage
+objects. Running this module reloads every management frame many times
+against generated data and fails if memory keeps growing:
+
+    python -m admin_tool.services.memory --reloads 50
+
+It needs a display; on a headless machine run it under ``xvfb-run``.
+"""
+import argparse
+import gc
+import os
+import sys
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple
+
+import customtkinter as ctk
+
+MB = 1024 * 1024
+
+def current_rss() -> Optional[int]:
+    """Resident set size in bytes, where the platform makes it cheap to read.
+
+    Without /proc (macOS) this is the peak RSS, which is still good enough
+    to tell that the budget was exceeded. None on Windows.
+    """
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        pass
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Reported in bytes on macOS and in kilobytes everywhere else
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+def count_widgets(widget) -> int:
+    return 1 + sum(count_widgets(child) for child in widget.winfo_children())
+
+def count_images(objects=None) -> int:
+    return sum(1 for obj in (objects if objects is not None else gc.get_objects()) if isinstance(obj, ctk.CTkImage))
+
+@dataclass
+class MemorySample:
+    rss: Optional[int]
+    traced: int
+    images: Optional[int] = None  # Only counted in detailed samples
+    objects: int = 0
+    widgets: Dict[str, int] = field(default_factory=dict)
+
+    def __str__(self):
+        rss = f"{self.rss / MB:.1f} MB" if self.rss is not None else "n/a"
+        if self.images is None:
+            return f"RSS {rss}, traced {self.traced / MB:.1f} MB"
+        widgets = ", ".join(f"{name}: {count}" for name, count in self.widgets.items())
+        return (f"RSS {rss}, traced {self.traced / MB:.1f} MB, {self.images} images, "
+                f"{self.objects} objects, widgets ({widgets})")
+
+class MemoryMonitor:
+    """Checks memory use against a budget.
+
+    Plain checks only read the RSS. The detailed mode runs a full gc pass and
+    walks every object, and tracemalloc slows every allocation down, so both
+    are opt-in.
+    """
+
+    def __init__(self, budget_mb: float = 1024, detailed: bool = False,
+                 trace: bool = False, trace_frames: int = 10):
+        self.budget = budget_mb * MB
+        self.detailed = detailed
+        self.baseline = None
+        if trace:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(trace_frames)
+            self.baseline = tracemalloc.take_snapshot()
+
+    def sample(self, frames: Optional[Dict[str, object]] = None) -> MemorySample:
+        gc.collect()
+        objects = gc.get_objects()
+        return MemorySample(
+            rss=current_rss(),
+            traced=tracemalloc.get_traced_memory()[0],
+            images=count_images(objects),
+            objects=len(objects),
+            widgets={name: count_widgets(frame) for name, frame in (frames or {}).items()}
+        )
+
+    def check(self, frames: Optional[Dict[str, object]] = None) -> MemorySample:
+        """Take a sample and print a warning with the top allocation sites when over budget."""
+        if self.detailed:
+            sample = self.sample(frames)
+        else:
+            sample = MemorySample(rss=current_rss(), traced=tracemalloc.get_traced_memory()[0])
+        used = sample.rss if sample.rss is not None else sample.traced
+        if used > self.budget:
+            print(f"Memory budget of {self.budget / MB:.0f} MB exceeded: {sample}")
+            for stat in self.top_allocations():
+                print(f"  {stat}")
+        return sample
+
+    def top_allocations(self, limit: int = 10):
+        """Allocation sites that grew the most since the monitor started."""
+        if self.baseline is None:
+            return []
+        snapshot = tracemalloc.take_snapshot()
+        return snapshot.compare_to(self.baseline, 'lineno')[:limit]
+
+def measure_reloads(reloads: int = 30, warmup: int = 5,
+                    rows: int = 20) -> Tuple[MemorySample, MemorySample, list]:
+    """Reload every management frame repeatedly.
+
+    Returns samples taken after the warmup and at the end, and the allocation
+    sites that grew the most in between.
+    """
+    import tempfile
+    from datetime import datetime, timedelta
+    from pathlib import Path
+
+    from ..components import UserManagementFrame, PhotoManagementFrame, CommentManagementFrame
+    from ..database import SnapshotStore
+    from ..models import User, Photo, Comment
+    from .fake_image_server import FakeImageServer
+    from .invalidation import InvalidationBus
+    from .image_loader import get_image_loader
+
+    server = FakeImageServer().start()
+    now = datetime.now()
+    users = [User(id=i, username=f"user{i}", email=f"user{i}@example.com",
+                  profile_image=server.url(f"/profile/{i}.png"), created_at=now - timedelta(days=i))
+             for i in range(rows)]
+    photos = [Photo(id=i, url=server.url(f"/photo/{i}.png"), title=f"Photo {i}", created_at=now - timedelta(days=i),
+                    user_id=i, username=f"user{i}", email=f"user{i}@example.com", like_count=i, comment_count=i)
+              for i in range(rows)]
+    comments = [Comment(id=i, content=f"Comment {i}", created_at=now - timedelta(days=i), user_id=i, photo_id=i,
+                        username=f"user{i}", user_profile_image=server.url(f"/profile/{i}.png"),
+                        photo_url=server.url(f"/photo/{i}.png"), photo_title=f"Photo {i}")
+                for i in range(rows)]
+
+    root = ctk.CTk()
+    root.withdraw()
+    snapshot = SnapshotStore(Path(tempfile.mkdtemp()) / 'snapshot.sqlite3')
+    events = InvalidationBus(root)
+    frames = {
+        'users': UserManagementFrame(root, snapshot, events),
+        'photos': PhotoManagementFrame(root, snapshot, events),
+        'comments': CommentManagementFrame(root, snapshot, events),
+    }
+
+    def reload_all():
+        frames['users'].render(users)
+        frames['photos'].render(photos)
+        frames['comments'].render(comments)
+        # Let the image loader deliver every thumbnail before measuring
+        while get_image_loader().pending:
+            root.update()
+            time.sleep(0.001)
+        root.update()
+
+    was_tracing = tracemalloc.is_tracing()
+    monitor = MemoryMonitor(trace=True)
+    try:
+        for _ in range(warmup):
+            reload_all()
+        before = monitor.sample(frames)
+        for _ in range(reloads):
+            reload_all()
+        after = monitor.sample(frames)
+        # Read the allocation sites before tracing stops
+        top = monitor.top_allocations()
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+        root.destroy()
+        snapshot.close()
+        server.stop()
+    return before, after, top
+
+def check_reload_leaks(reloads: int = 30, warmup: int = 5, rows: int = 20,
+                       tolerance_mb: float = 5, tolerance_objects: int = 1000) -> bool:
+    """Reload every management frame repeatedly and report whether memory stayed flat."""
+    before, after, top = measure_reloads(reloads, warmup, rows)
+    print(f"before: {before}")
+    print(f"after:  {after}")
+    leaked = (after.traced - before.traced > tolerance_mb * MB
+              or after.objects - before.objects > tolerance_objects
+              or after.images > before.images
+              or any(after.widgets[name] > count for name, count in before.widgets.items()))
+    if leaked:
+        for stat in top:
+            print(f"  {stat}")
+    return not leaked
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Check that reloading the management frames does not leak memory")
+    parser.add_argument('--reloads', type=int, default=30)
+    parser.add_argument('--rows', type=int, default=20)
+    parser.add_argument('--tolerance-mb', type=float, default=5)
+    args = parser.parse_args()
+    sys.exit(0 if check_reload_leaks(args.reloads, rows=args.rows, tolerance_mb=args.tolerance_mb) else 1)
@@ -0,0 +1,148 @@
+import hashlib
+import re
+import sqlite3
+import tempfile
+import threading
+import zlib
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from ..database import Database
+
+MERSENNE_PRIME = (1 << 31) - 1
+
+def shingles(text: str, size: int = 5) -> np.ndarray:
+    """Hashed character n-grams of the normalized text."""
+    normalized = " ".join(re.sub(r"[^\w]+", " ", text.lower()).split())
+    if not normalized:
+        return np.empty(0, dtype=np.int64)
+    if len(normalized) <= size:
+        grams = {normalized}
+    else:
+        grams = {normalized[i:i + size] for i in range(len(normalized) - size + 1)}
+    return np.fromiter((zlib.crc32(g.encode('utf-8')) for g in grams), dtype=np.int64, count=len(grams))
+
+class MinHasher:
+    def __init__(self, num_perm: int = 64, seed: int = 1):
+        rng = np.random.default_rng(seed)
+        self.a = rng.integers(1, MERSENNE_PRIME, size=(num_perm, 1), dtype=np.int64)
+        self.b = rng.integers(0, MERSENNE_PRIME, size=(num_perm, 1), dtype=np.int64)
+
+    def signature(self, hashed_shingles: np.ndarray) -> np.ndarray:
+        # Values are reduced below 2**31 first so a * x never overflows int64
+        x = (hashed_shingles % MERSENNE_PRIME)[None, :]
+        return ((self.a * x + self.b) % MERSENNE_PRIME).min(axis=1)
+
+class SpamAnalyzer(threading.Thread):
+    """Clusters near-identical comments with MinHash signatures and LSH banding.
+
+    Comments are streamed from the database and their text is never kept.
+    Every (band, bucket key, comment id) row is appended to a temporary
+    SQLite file rather than kept in memory, and no key is ever dropped: once
+    all comments are in, the rows are read back sorted by bucket and the
+    comments sharing a bucket are joined in a union-find keyed by comment id.
+    Memory is bounded by the batch size and the number of clustered comments.
+    """
+
+    def __init__(self, bands: int = 16, rows: int = 4, min_cluster_size: int = 3,
+                 min_shingles: int = 3, batch_size: int = 5000, work_dir: Optional[Path] = None):
+        super().__init__(daemon=True)
+        self.bands = bands
+        self.rows = rows
+        self.min_cluster_size = min_cluster_size
+        self.min_shingles = min_shingles
+        self.batch_size = batch_size
+        self.work_dir = work_dir
+        self.hasher = MinHasher(bands * rows)
+
+        self.parent: Dict[int, int] = {}
+        self._pending: List[tuple] = []
+        self._buckets: Optional[sqlite3.Connection] = None
+
+        self.processed = 0
+        self.clusters: Optional[List[List[int]]] = None
+        self.error: Optional[Exception] = None
+
+    def run(self):
+        try:
+            db = Database()
+            with tempfile.TemporaryDirectory(dir=self.work_dir) as tmp:
+                self.open_buckets(Path(tmp) / 'buckets.sqlite3')
+                for comment_id, content in db.iter_comment_texts(self.batch_size):
+                    self.add(comment_id, content or "")
+                    self.processed += 1
+                self.clusters = self.get_clusters()
+                self.close_buckets()
+        except Exception as e:
+            self.error = e
+
+    def open_buckets(self, path=':memory:'):
+        self._buckets = sqlite3.connect(str(path))
+        # Scratch data: nothing to recover after a crash
+        self._buckets.execute("PRAGMA journal_mode = OFF")
+        self._buckets.execute("PRAGMA synchronous = OFF")
+        self._buckets.execute("CREATE TABLE buckets (band INTEGER, key INTEGER, id INTEGER)")
+
+    def close_buckets(self):
+        self._buckets.close()
+        self._buckets = None
+
+    def add(self, comment_id: int, content: str):
+        if self._buckets is None:
+            self.open_buckets()
+        hashed = shingles(content)
+        if len(hashed) < self.min_shingles:
+            # Too short to tell spam from the many genuine "nice" or "wow" comments
+            return
+        signature = self.hasher.signature(hashed)
+        for band, values in enumerate(signature.reshape(self.bands, self.rows)):
+            # 64-bit keys: crc32 would collide between unrelated buckets at millions of comments
+            key = int.from_bytes(hashlib.blake2b(values.tobytes(), digest_size=8).digest(), 'big', signed=True)
+            self._pending.append((band, key, comment_id))
+        if len(self._pending) >= self.batch_size * self.bands:
+            self._flush()
+
+    def _flush(self):
+        self._buckets.executemany("INSERT INTO buckets (band, key, id) VALUES (?, ?, ?)", self._pending)
+        self._buckets.commit()
+        self._pending.clear()
+
+    def _find(self, comment_id: int) -> int:
+        root = comment_id
+        while self.parent.get(root, root) != root:
+            root = self.parent[root]
+        while comment_id != root:
+            self.parent[comment_id], comment_id = root, self.parent[comment_id]
+        return root
+
+    def _union(self, existing: int, comment_id: int):
+        self.parent.setdefault(existing, existing)
+        self.parent.setdefault(comment_id, comment_id)
+        root_a, root_b = self._find(existing), self._find(comment_id)
+        if root_a != root_b:
+            self.parent[root_b] = root_a
+
+    def _join_buckets(self):
+        """Union every comment with the first one of each bucket it shares."""
+        self._flush()
+        previous, first_id = None, None
+        for band, key, comment_id in self._buckets.execute(
+                "SELECT band, key, id FROM buckets ORDER BY band, key, id"):
+            if (band, key) == previous:
+                self._union(first_id, comment_id)
+            else:
+                previous, first_id = (band, key), comment_id
+
+    def get_clusters(self) -> List[List[int]]:
+        """Clusters of at least `min_cluster_size` comment ids, largest first."""
+        if self._buckets is not None:
+            self._join_buckets()
+        groups: Dict[int, List[int]] = {}
+        for comment_id in self.parent:
+            groups.setdefault(self._find(comment_id), []).append(comment_id)
+        return sorted(
+            (sorted(members) for members in groups.values() if len(members) >= self.min_cluster_size),
+            key=len, reverse=True
+        )
@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+from PIL import Image, ImageDraw, ImageFilter
+
+from admin_tool.services.duplicate_detection import (
+    PhotoHashIndex, hamming_distances, image_hashes, perceptual_hash
+)
+
+def sample_image(seed: int, size=(256, 256)) -> Image.Image:
+    """Random shapes, so different seeds give unrelated pictures."""
+    rng = np.random.default_rng(seed)
+    img = Image.new('RGB', size, tuple(int(c) for c in rng.integers(0, 256, 3)))
+    draw = ImageDraw.Draw(img)
+    for _ in range(12):
+        x0, y0 = rng.integers(0, size[0] - 20, 2)
+        x1, y1 = x0 + rng.integers(20, 120), y0 + rng.integers(20, 120)
+        draw.ellipse((int(x0), int(y0), int(x1), int(y1)), fill=tuple(int(c) for c in rng.integers(0, 256, 3)))
+    return img
+
+def distance(a: int, b: int) -> int:
+    return int(hamming_distances(np.array([a], dtype=np.uint64), np.array([b], dtype=np.uint64))[0, 0])
+
+@pytest.fixture
+def index(tmp_path):
+    return PhotoHashIndex(tmp_path / 'hashes.npz')
+
+def test_hamming_distances_count_differing_bits():
+    query = np.array([0, 0xFF], dtype=np.uint64)
+    hashes = np.array([0, 1, 0xFFFFFFFFFFFFFFFF], dtype=np.uint64)
+    assert hamming_distances(query, hashes).tolist() == [[0, 1, 64], [8, 7, 56]]
+
+def test_hashes_survive_resizing_and_recompression():
+    original = sample_image(1)
+    copy = original.resize((180, 180)).filter(ImageFilter.GaussianBlur(1))
+    other = sample_image(2)
+    assert distance(perceptual_hash(original), perceptual_hash(copy)) <= 6
+    assert distance(perceptual_hash(original), perceptual_hash(other)) > 6
+
+def test_find_clusters_groups_copies_only(index):
+    originals = [sample_image(seed) for seed in range(4)]
+    images = originals + [originals[0].resize((200, 200)), originals[2].resize((300, 300))]
+    index.add(list(range(1, 7)), [image_hashes(img) for img in images])
+    assert index.find_clusters(threshold=6) == [[1, 5], [3, 6]]
+
+def test_clusters_chain_but_within_checks_the_kept_photo(index):
+    # 1 and 2 differ by 4 bits, 2 and 3 by 4 more: one cluster, but 3 is 8 bits from 1
+    hashes = [{'ahash': 0, 'dhash': value, 'phash': value} for value in (0, 0xF, 0xFF)]
+    index.add([1, 2, 3], hashes)
+    assert index.find_clusters(threshold=6) == [[1, 2, 3]]
+    assert index.within(1, [2, 3], threshold=6) == [2]
+
+def test_retain_and_failed_ids_survive_a_reload(index):
+    index.add([1, 2, 3], [{'ahash': i, 'dhash': i, 'phash': i} for i in range(3)])
+    index.failed_ids = np.array([4, 5], dtype=np.int64)
+    index.last_scanned_id = 5
+    assert index.retain([1, 3, 5]) == 1
+    index.save()
+
+    loaded = PhotoHashIndex(index.path).load()
+    assert loaded.photo_ids.tolist() == [1, 3]
+    assert loaded.failed_ids.tolist() == [5]
+    assert loaded.last_scanned_id == 5
+    assert loaded.hashes['phash'].tolist() == [0, 2]
@@ -0,0 +1,79 @@
+import time
+
+import pytest
+
+from admin_tool.services.fake_image_server import FakeImageServer
+from admin_tool.services.image_client import ImageClient
+
+@pytest.fixture
+def server():
+    server = FakeImageServer().start()
+    yield server
+    server.stop()
+
+def make_client(**kwargs):
+    options = dict(connect_timeout=1, read_timeout=1, retries=0, backoff=0, failure_threshold=3, cooldown=30)
+    options.update(kwargs)
+    return ImageClient(**options)
+
+def test_fetch_image_decodes_png(server):
+    img = make_client().fetch_image(server.url('/photo/1.png'))
+    assert img is not None
+    assert img.size == (256, 256)
+
+def test_slow_host_times_out_instead_of_blocking(server):
+    client = make_client(read_timeout=0.2)
+    start = time.monotonic()
+    assert client.fetch(server.url('/slow.png?delay=2')) is None
+    assert time.monotonic() - start < 1.5
+
+def test_transient_failures_are_retried(server):
+    server.fail_next = 2
+    content = make_client(retries=2).fetch(server.url('/retry.png'))
+    assert content is not None
+    assert server.statuses == [503, 503, 200]
+
+def test_retries_give_up_after_the_limit(server):
+    assert make_client(retries=2).fetch(server.url('/broken.png?status=503')) is None
+    assert server.request_count == 3
+
+def test_fresh_cache_entry_is_served_without_a_request(server):
+    client = make_client(max_age=60)
+    first = client.fetch(server.url('/cached.png'))
+    assert client.fetch(server.url('/cached.png')) == first
+    assert server.request_count == 1
+
+def test_stale_cache_entry_is_revalidated_with_304(server):
+    client = make_client(max_age=0)
+    first = client.fetch(server.url('/revalidate.png'))
+    second = client.fetch(server.url('/revalidate.png'))
+    assert second == first
+    assert server.statuses == [200, 304]
+
+def test_breaker_opens_after_repeated_failures(server):
+    client = make_client(failure_threshold=2)
+    url = server.url('/image.png')
+    for _ in range(2):
+        assert client.fetch(url + '?status=503') is None
+    assert not client.is_host_available(url)
+
+    # While open, no request reaches the host at all
+    assert client.fetch(server.url('/other.png')) is None
+    assert server.request_count == 2
+
+def test_breaker_serves_stale_copy_while_open(server):
+    client = make_client(failure_threshold=1, max_age=0)
+    url = server.url('/stale.png')
+    content = client.fetch(url)
+    server.down = True
+    assert client.fetch(url) == content  # Failed revalidation opens the breaker
+    assert client.fetch(url) == content  # Open breaker, still the stale copy
+
+def test_breaker_closes_after_a_successful_probe(server):
+    client = make_client(failure_threshold=1, cooldown=0.1)
+    assert client.fetch(server.url('/image.png?status=503')) is None
+    assert not client.is_host_available(server.url())
+
+    time.sleep(0.15)
+    assert client.fetch(server.url('/image.png')) is not None
+    assert client.is_host_available(server.url())
@@ -0,0 +1,109 @@
+from types import SimpleNamespace
+
+import pytest
+
+from admin_tool.components.management_frames import ListingFrame
+from admin_tool.services import invalidation
+from admin_tool.services.invalidation import InvalidationBus
+
+class FakeRoot:
+    """Stands in for Tk: `after` callbacks run when the test calls poll()."""
+
+    def __init__(self):
+        self.scheduled = []
+
+    def after(self, ms, callback):
+        self.scheduled.append(callback)
+
+    def poll(self):
+        scheduled, self.scheduled = self.scheduled, []
+        for callback in scheduled:
+            callback()
+
+class FakeTab:
+    """The refresh logic of a listing tab, without its widgets."""
+    invalidate = ListingFrame.invalidate
+    on_show = ListingFrame.on_show
+
+    def __init__(self, mapped=True):
+        self.mapped = mapped
+        self.stale = False
+        self.refreshes = 0
+
+    def winfo_ismapped(self):
+        return self.mapped
+
+    def refresh(self):
+        self.refreshes += 1
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(invalidation, 'time', SimpleNamespace(monotonic=lambda: now[0]))
+    return now
+
+@pytest.fixture
+def root():
+    return FakeRoot()
+
+def test_events_wait_for_the_debounce(root, clock):
+    bus = InvalidationBus(root, debounce=300)
+    calls = []
+    bus.subscribe(('photo',), lambda: calls.append(1))
+
+    bus.publish('photo')
+    clock[0] += 0.2
+    root.poll()
+    assert calls == []
+
+    # Another write restarts the wait
+    bus.publish('photo')
+    clock[0] += 0.2
+    root.poll()
+    assert calls == []
+
+    clock[0] += 0.1
+    root.poll()
+    assert calls == [1]
+
+def test_a_burst_of_writes_refreshes_each_subscriber_once(root, clock):
+    bus = InvalidationBus(root, debounce=300)
+    tab, other = FakeTab(), FakeTab()
+    bus.subscribe(('user', 'photo', 'comment'), tab.invalidate)
+    bus.subscribe(('comment',), other.invalidate)
+
+    for topic in ('user', 'photo', 'photo', 'user'):
+        bus.publish(topic)
+    clock[0] += 1
+    root.poll()
+    root.poll()
+
+    assert tab.refreshes == 1
+    assert other.refreshes == 0
+
+def test_hidden_tabs_refresh_when_shown(root, clock):
+    bus = InvalidationBus(root, debounce=300)
+    shown, hidden = FakeTab(), FakeTab(mapped=False)
+    bus.subscribe(('photo',), shown.invalidate)
+    bus.subscribe(('photo',), hidden.invalidate)
+
+    bus.publish('photo')
+    bus.publish('photo')
+    clock[0] += 1
+    root.poll()
+    assert (shown.refreshes, hidden.refreshes) == (1, 0)
+
+    hidden.on_show()
+    hidden.on_show()
+    assert hidden.refreshes == 1
+
+def test_a_failing_subscriber_does_not_stop_delivery(root, clock):
+    bus = InvalidationBus(root, debounce=0)
+    tab = FakeTab()
+    bus.subscribe(('user',), lambda: 1 / 0)
+    bus.subscribe(('user',), tab.invalidate)
+
+    bus.publish('user')
+    root.poll()
+    assert tab.refreshes == 1
+    assert root.scheduled  # Still polling
@@ -0,0 +1,24 @@
+import tkinter
+
+import pytest
+
+from admin_tool.services.memory import MB, measure_reloads
+
+def _has_display():
+    try:
+        tkinter.Tk().destroy()
+    except tkinter.TclError:
+        return False
+    return True
+
+# Builds real Tk windows: run under xvfb-run on a headless machine
+pytestmark = pytest.mark.skipif(not _has_display(), reason="needs a display (run under xvfb-run)")
+
+def test_reloading_frames_keeps_memory_bounded():
+    before, after, top = measure_reloads(reloads=10, warmup=3, rows=10)
+    details = f"before: {before}\nafter: {after}\n" + "\n".join(str(stat) for stat in top)
+
+    assert after.widgets == before.widgets, details
+    assert after.images <= before.images, details
+    assert after.objects - before.objects < 1000, details
+    assert after.traced - before.traced < 5 * MB, details
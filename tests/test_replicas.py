@@ -0,0 +1,121 @@
+import os
+import threading
+import time
+
+import pytest
+from mysql.connector import Error
+
+from admin_tool.database.replicas import Replica, ReplicaPool, get_replica_pool
+
+class FakeReplica(Replica):
+    """Replica whose probes report a preset lag instead of querying MySQL."""
+
+    def __init__(self, name, lag=0, probe_delay=0.0):
+        super().__init__(name, 3306)
+        self.reported_lag = lag
+        self.probe_delay = probe_delay
+        self.connects = 0
+
+    def replication_lag(self):
+        time.sleep(self.probe_delay)
+        if self.reported_lag == 'down':
+            raise Error("Can't connect")
+        return self.reported_lag
+
+    def _open(self):
+        self.connects += 1
+        return FakeConnection()
+
+class FakeConnection:
+    def cursor(self, dictionary=False):
+        return self
+
+    def close(self):
+        pass
+
+def wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not reached"
+        time.sleep(0.01)
+
+@pytest.fixture
+def make_pool():
+    pools = []
+    def make(replicas, **kwargs):
+        pool = ReplicaPool(replicas, **dict(dict(max_lag=5, check_interval=0.05), **kwargs))
+        pools.append(pool)
+        return pool
+    yield make
+    for pool in pools:
+        pool.close()
+
+def test_choose_never_waits_on_probes(make_pool):
+    pool = make_pool([FakeReplica('slow', probe_delay=1)])
+    start = time.monotonic()
+    assert pool.choose() is None  # Not probed yet: reads go to the primary
+    assert time.monotonic() - start < 0.05
+
+def test_healthy_replicas_are_used_round_robin(make_pool):
+    a, b = FakeReplica('a'), FakeReplica('b')
+    pool = make_pool([a, b])
+    wait_for(lambda: a.healthy and b.healthy)
+    assert {pool.choose(), pool.choose()} == {a, b}
+
+def test_lagging_and_down_replicas_are_skipped(make_pool):
+    ok, lagging, down = FakeReplica('ok'), FakeReplica('lagging', lag=60), FakeReplica('down', lag='down')
+    pool = make_pool([ok, lagging, down])
+    wait_for(lambda: ok.healthy)
+    assert [pool.choose() for _ in range(3)] == [ok, ok, ok]
+
+def test_failed_replica_is_skipped_until_the_checker_sees_it_again(make_pool):
+    replica = FakeReplica('a')
+    pool = make_pool([replica])
+    wait_for(lambda: replica.healthy)
+    replica.cursor()
+    pool.mark_unhealthy(replica, Error("Lost connection"))
+    assert pool.choose() is None
+    wait_for(lambda: pool.choose() is replica)
+    replica.cursor()
+    assert replica.connects == 2  # The failed connection was replaced
+
+def test_each_thread_gets_its_own_connection(make_pool):
+    replica = FakeReplica('a')
+    make_pool([replica])
+    cursors = []
+    thread = threading.Thread(target=lambda: cursors.append(replica.cursor()))
+    thread.start()
+    thread.join()
+    assert replica.cursor() is replica.cursor()
+    assert replica.cursor() is not cursors[0]
+
+def test_the_process_shares_one_pool():
+    assert get_replica_pool() is get_replica_pool()
+
+# Against real servers, e.g. the ones in docker-compose.replicas.yml:
+#   DB_USER=root DB_PASSWORD=admin DB_NAME=DevAtHomeDB DB_REPLICAS=127.0.0.1:3308,127.0.0.1:3309 pytest tests
+requires_replicas = pytest.mark.skipif(
+    not os.getenv('DB_REPLICAS'), reason="DB_REPLICAS is not set"
+)
+
+@requires_replicas
+def test_configured_replicas_become_healthy():
+    pool = ReplicaPool.from_env()
+    try:
+        wait_for(lambda: all(replica.healthy for replica in pool.replicas), timeout=10)
+        chosen = {pool.choose() for _ in pool.replicas}
+        assert chosen == set(pool.replicas)
+        for replica in chosen:
+            cursor = replica.cursor()
+            cursor.execute("SELECT 1 AS ok")
+            assert cursor.fetchall() == [{'ok': 1}]
+    finally:
+        pool.close()
+
+@requires_replicas
+def test_unreachable_replica_fails_fast():
+    replica = Replica('10.255.255.1', 3306, connect_timeout=1)
+    start = time.monotonic()
+    with pytest.raises(Error):
+        replica.cursor()
+    assert time.monotonic() - start < 3
@@ -0,0 +1,108 @@
+from dataclasses import replace
+from datetime import datetime, timedelta
+
+import pytest
+
+from admin_tool.database.snapshot import SnapshotStore
+from admin_tool.models import Photo
+
+START = datetime(2024, 1, 1)
+
+def make_photo(photo_id: int, likes: int = 0) -> Photo:
+    return Photo(id=photo_id, url=f"https://images.example/{photo_id}.png", title=f"Photo {photo_id}",
+                 created_at=START + timedelta(hours=photo_id), user_id=1, username="user1",
+                 email="user1@example.com", like_count=likes, comment_count=0)
+
+class FakeDatabase:
+    """The photo queries a sync makes, answered from a dict; records what was asked."""
+
+    def __init__(self, photos):
+        self.photos = {photo.id: photo for photo in photos}
+        self.calls = []
+
+    def get_latest_photos(self):
+        self.calls.append('all')
+        return sorted(self.photos.values(), key=lambda photo: (photo.created_at, photo.id), reverse=True)
+
+    def get_photos_since(self, created_at, photo_id):
+        self.calls.append('since')
+        return [photo for photo in self.photos.values() if (photo.created_at, photo.id) > (created_at, photo_id)]
+
+    def get_photo_ids(self):
+        return list(self.photos)
+
+    def get_photos_by_ids(self, photo_ids):
+        return [self.photos[photo_id] for photo_id in photo_ids if photo_id in self.photos]
+
+    def get_photo_counts(self, photo_ids=None):
+        self.calls.append(('counts', None if photo_ids is None else sorted(photo_ids)))
+        return {photo.id: {'like_count': photo.like_count, 'comment_count': photo.comment_count}
+                for photo in self.photos.values() if photo_ids is None or photo.id in photo_ids}
+
+@pytest.fixture
+def snapshot(tmp_path):
+    store = SnapshotStore(tmp_path / 'snapshot.sqlite3')
+    yield store
+    store.close()
+
+def ids(snapshot):
+    return [photo.id for photo in snapshot.load('photos')]
+
+def test_later_syncs_only_fetch_rows_past_the_watermark(snapshot):
+    db = FakeDatabase([make_photo(i) for i in range(1, 4)])
+    snapshot.sync('photos', db)
+    assert db.calls == ['all']
+    assert ids(snapshot) == [3, 2, 1]
+
+    db.photos[4] = make_photo(4)
+    db.calls.clear()
+    snapshot.sync('photos', db)
+    assert db.calls == ['since']
+    assert ids(snapshot) == [4, 3, 2, 1]
+
+def test_deleted_rows_are_removed_and_restored_rows_come_back(snapshot):
+    db = FakeDatabase([make_photo(i) for i in range(1, 4)])
+    snapshot.sync('photos', db)
+
+    hidden = db.photos.pop(2)
+    snapshot.sync('photos', db)
+    assert ids(snapshot) == [3, 1]
+
+    # An undone delete is older than the watermark, so only the live ids bring it back
+    db.photos[2] = hidden
+    plan = snapshot.plan_sync('photos')
+    plan.rows = db.get_photos_since(*plan.watermark)
+    plan.live_ids = set(db.get_photo_ids())
+    assert plan.missing_ids() == [2]
+    snapshot.sync('photos', db)
+    assert ids(snapshot) == [3, 2, 1]
+
+def test_only_visible_counts_are_refreshed_between_full_count_refreshes(snapshot):
+    db = FakeDatabase([make_photo(i) for i in range(1, 4)])
+    snapshot.sync('photos', db)
+
+    db.photos = {photo_id: replace(photo, like_count=10) for photo_id, photo in db.photos.items()}
+    snapshot.sync('photos', db, visible_ids=[1])
+    assert {photo.id: photo.like_count for photo in snapshot.load('photos')} == {1: 10, 2: 0, 3: 0}
+
+    # Nothing on screen: no count queries at all
+    db.calls.clear()
+    snapshot.sync('photos', db)
+    assert db.calls == ['since']
+
+    snapshot.count_refresh_interval = 0
+    db.calls.clear()
+    snapshot.sync('photos', db, visible_ids=[1])
+    assert db.calls == ['since', ('counts', None)]
+    assert {photo.id: photo.like_count for photo in snapshot.load('photos')} == {1: 10, 2: 10, 3: 10}
+
+def test_pages_are_sorted_by_model_fields_only(snapshot):
+    db = FakeDatabase([make_photo(1, likes=5), make_photo(2, likes=1), make_photo(3, likes=9)])
+    snapshot.sync('photos', db)
+
+    page = snapshot.load_page('photos', 'like_count', descending=False, limit=2)
+    assert [photo.id for photo in page] == [2, 1]
+    assert [photo.id for photo in snapshot.load_page('photos', 'like_count', limit=2, offset=2)] == [2]
+
+    with pytest.raises(ValueError):
+        snapshot.load_page('photos', "like_count') DESC; DROP TABLE photos; --")
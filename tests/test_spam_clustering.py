@@ -0,0 +1,47 @@
+import random
+import string
+
+import pytest
+
+from admin_tool.services.spam_clustering import SpamAnalyzer, shingles
+
+SPAM = "Buy cheap followers now at followers dot example, best prices guaranteed"
+
+def random_comment(rng: random.Random) -> str:
+    return " ".join("".join(rng.choices(string.ascii_lowercase, k=6)) for _ in range(10))
+
+@pytest.fixture
+def analyzer():
+    analyzer = SpamAnalyzer(min_cluster_size=3)
+    analyzer.open_buckets(':memory:')
+    yield analyzer
+    analyzer.close_buckets()
+
+def test_short_comments_are_not_clustered(analyzer):
+    for comment_id, content in enumerate(["nice", "Nice!", "nice", "wow", "WOW", "wow!!"]):
+        analyzer.add(comment_id, content)
+    assert analyzer.get_clusters() == []
+
+def test_shingles_ignore_case_and_punctuation():
+    assert set(shingles("Great photo!!")) == set(shingles("great   PHOTO"))
+
+def test_spam_wave_is_found_among_unrelated_comments(analyzer):
+    rng = random.Random(1)
+    for comment_id in range(3000):
+        analyzer.add(comment_id, random_comment(rng))
+    wave = list(range(10000, 10012))
+    for n, comment_id in enumerate(wave):
+        analyzer.add(comment_id, SPAM + "!" * (n % 3) + f" {n % 2}")
+    assert analyzer.get_clusters() == [wave]
+
+def test_every_comment_sharing_a_bucket_is_kept(analyzer):
+    # Several waves at once share no buckets with each other but fill many;
+    # none of their members may be lost to a collision
+    waves = {}
+    for w in range(20):
+        text = f"wave {w} " + random_comment(random.Random(w))
+        waves[w] = [w * 1000 + n for n in range(25)]
+        for comment_id in waves[w]:
+            analyzer.add(comment_id, text)
+    clusters = analyzer.get_clusters()
+    assert sorted(clusters) == sorted(waves.values())